@@ -16,6 +16,7 @@ from typing import Dict, List, Optional
 from dotenv import load_dotenv
 
 from google_sheets_client import GoogleSheetsClient, SheetsConfig, extract_spreadsheet_id
+from customer_cache import invalidate_customer_cache
 
 # Load environment variables
 load_dotenv()
@@ -164,6 +165,9 @@ class CustomerManager:
                 [customer_row]
             )
             
+            # The task CLI's cached customer list no longer matches the sheet
+            invalidate_customer_cache()
+            
             logger.info(f"Successfully added customer: {customer_data['company_name']}")
             return True
             
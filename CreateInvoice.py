@@ -398,6 +398,18 @@ ST_Faktura
             return False
 
 
+def _shorten(text: str, width: int, suffix_outside: bool = False) -> str:
+    """
+    Cut text to at most width characters, ending in '...' when shortened (one length check)
+    
+    With suffix_outside the '...' is appended after width characters instead,
+    as the task list has always shown it.
+    """
+    if len(text) <= width:
+        return text
+    return text[:width] + '...' if suffix_outside else text[:width - 3] + '...'
+
+
 def display_customers(customers: List[Dict[str, str]]) -> None:
     """
     Display available customers for selection
@@ -483,7 +495,7 @@ def display_tasks(tasks: List[Dict[str, str]]) -> None:
         total_minutes += minutes
         
         print(f"{i:2d}. {task['date']} - {task['tasktype']}")
-        print(f"    {task['description'][:60]}{'...' if len(task['description']) > 60 else ''}")
+        print(f"    {_shorten(task['description'], 60, suffix_outside=True)}")
         print(f"    Time: {hours:.2f} hours ({minutes} minutes)")
         print()
     
@@ -629,7 +641,7 @@ def warn_already_invoiced(tasks: List[Dict[str, str]]) -> bool:
     print("\n⚠️  The following selected tasks have already been invoiced:")
     for idx, (task, meta) in enumerate(already, 1):
         desc = task.get('description','')
-        short_desc = (desc[:47] + '...') if len(desc) > 50 else desc
+        short_desc = _shorten(desc, 50)
         print(f" {idx}. {task['date']} - {task['tasktype']} ({short_desc}) -> Faktura #{meta.get('invoice_number')} on {meta.get('date')}")
     while True:
         choice = input("Proceed anyway and include them again? (y/N): ").strip().lower()
@@ -889,7 +901,7 @@ def main() -> None:
                 m = safe_int(t.get('time_minutes'))
                 total_minutes_preview += m
                 desc = t.get('description','')
-                short_desc = (desc[:70] + '...') if len(desc) > 73 else desc
+                short_desc = _shorten(desc, 73)
                 print(f" {idx:2d}. {t.get('date','')} | {t.get('tasktype','')} | {m} min | Sum: {t.get('sum','0')} | {short_desc}")
             print("-"*60)
             # Derived monetary summary from selected tasks' sum column
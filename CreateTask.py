@@ -12,23 +12,36 @@ Following copilot instructions for cross-platform compatibility, proper logging,
 """
 
 import os
+import argparse
 import logging
+import logging.handlers
 import sys
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from dotenv import load_dotenv
 
-from google_sheets_client import GoogleSheetsClient, SheetsConfig, extract_spreadsheet_id
+from google_sheets_client import GoogleSheetsClient, SheetsConfig
+from customer_cache import CUSTOMER_CACHE_TTL, load_cached_customers, save_cached_customers
 
-# Load environment variables
+try:
+    from prompt_toolkit import prompt as fuzzy_prompt
+    from prompt_toolkit.completion import FuzzyCompleter, WordCompleter
+except ImportError:  # prompt_toolkit is optional; fall back to numbered selection
+    fuzzy_prompt = None
+
+# Load environment variables at import: LOG_LEVEL below is read at import too.
+# google_sheets_client already does this, so deferring it to main() saved nothing
 load_dotenv()
 
 # Configure logging
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+_task_log_file_handler = logging.FileHandler('st_faktura_tasks.log')
+_task_log_file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
 logging.basicConfig(
     level=getattr(logging, os.getenv('LOG_LEVEL', 'INFO')),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
-        logging.FileHandler('st_faktura_tasks.log'),
+        # Buffer file records in memory; errors and logging.shutdown() at exit flush them
+        logging.handlers.MemoryHandler(256, target=_task_log_file_handler),
         logging.StreamHandler()
     ]
 )
@@ -39,161 +52,300 @@ SPREADSHEET_ID = "170onDFFCveCzV6Q9F1_IhsG2LBRcw5MYxJbyocVJmq0"
 
 # Customer sheet (gid=0)
 CUSTOMER_SHEET_URL = "https://docs.google.com/spreadsheets/d/170onDFFCveCzV6Q9F1_IhsG2LBRcw5MYxJbyocVJmq0/edit?gid=0#gid=0"
-CUSTOMER_SHEET_RANGE = "A:H"
+CUSTOMER_SHEET_RANGE = "Kunder!A:I"
+
+# Customer columns A:I in sheet order, with the value used when a cell is missing
+CUSTOMER_FIELDS = ('id', 'name', 'address', 'cvr', 'zip', 'town', 'phone', 'email', 'hourly_rate')
+CUSTOMER_DEFAULTS = ['', '', '', '', '', '', '', '', '0']
 
 # Task types sheet (gid=288943747)
 TASKTYPE_SHEET_URL = "https://docs.google.com/spreadsheets/d/170onDFFCveCzV6Q9F1_IhsG2LBRcw5MYxJbyocVJmq0/edit?gid=288943747#gid=288943747"
-TASKTYPE_SHEET_RANGE = "'Tasktype'!A:A"
+TASKTYPE_SHEET_RANGE = "Tasktype!A:A"
 
 # Tasks sheet (gid=1276274497) - Sheet name is "Opgave"
 TASKS_SHEET_URL = "https://docs.google.com/spreadsheets/d/170onDFFCveCzV6Q9F1_IhsG2LBRcw5MYxJbyocVJmq0/edit?gid=1276274497#gid=1276274497"
 TASKS_SHEET_RANGE = "Opgave!A:I"  # Include all task columns through I (including Sum)
+TASKS_HEADER_RANGE = "Opgave!A1:I1"
+TASKS_HEADERS = (
+    "Date", "Customer Name", "Tasktype", "Pricing Type", "Task Description",
+    "Task Time (Minutes)", "Price", "Discount (%)", "Sum"
+)
+
+# Separator line used around the CLI screens
+SEP = "=" * 60
+
+# Answers accepted for quitting a prompt and for confirming (compared lowercased)
+QUIT = frozenset({'q', 'quit', 'exit'})
+YES = frozenset({'y', 'yes'})
 
 
 class TaskManager:
     """
     Manages task operations following clean architecture principles
+    
+    The task type list returned by get_task_types is kept current in memory:
+    add_new_task_type appends to that same list object (and to any list passed
+    as existing) rather than re-reading the sheet, so callers holding a
+    reference always see newly created task types.
     """
     
-    def __init__(self, sheets_client: GoogleSheetsClient):
+    def __init__(self, sheets_client: GoogleSheetsClient, batch_size: int = 1,
+                 customer_cache_ttl: float = 0):
         """
         Initialize task manager
         
         Args:
             sheets_client: Configured Google Sheets client
+            batch_size: Number of tasks to buffer before appending them in one request.
+                The default of 1 writes every task immediately; callers opting in to
+                larger batches must call flush(force=True) when they are done.
+            customer_cache_ttl: Seconds the local customer cache stays valid (0 disables it)
         """
         self.sheets_client = sheets_client
+        self.batch_size = max(1, batch_size)
+        self.customer_cache_ttl = customer_cache_ttl
+        # Task rows waiting to be appended by flush()
+        self._pending_tasks: List[List[str]] = []
         # All sheets are in the same spreadsheet
         self.spreadsheet_id = SPREADSHEET_ID
+        # Task types from the last successful read, kept in sync on add,
+        # plus their casefolded forms for duplicate checks
+        self._task_types_cache: Optional[List[str]] = None
+        self._task_types_folded: Set[str] = set()
+        # ISO date stamped on new tasks, see the today property
+        self._today_date = None
+        self._today = ""
+        
+    @property
+    def today(self) -> str:
+        """
+        Today's date as YYYY-MM-DD, formatted once per calendar day
+        
+        Returns:
+            ISO formatted date string
+        """
+        from datetime import date
+        
+        current = date.today()
+        if current != self._today_date:
+            self._today_date = current
+            self._today = current.isoformat()
+        return self._today
+    
+    def _load_cached_customers(self) -> Optional[List[Dict[str, str]]]:
+        """
+        Load customers from the local cache if it is fresh for this spreadsheet
         
-    def get_customers(self) -> List[Dict[str, str]]:
+        Returns:
+            Cached customer dictionaries or None on a miss
+        """
+        return load_cached_customers(self.spreadsheet_id, self.customer_cache_ttl)
+    
+    def _save_cached_customers(self, customers: List[Dict[str, str]]) -> None:
+        """
+        Store customers in the local cache, keyed by spreadsheet ID
+        
+        Args:
+            customers: Customer dictionaries to cache
+        """
+        save_cached_customers(self.spreadsheet_id, customers)
+    
+    def prefetch(self, refresh_customers: bool = False) -> Tuple[List[Dict[str, str]], List[str], Optional[List[List[str]]]]:
+        """
+        Fetch customers, task types and the tasks header row in one batchGet request
+        
+        Customers are served from the local cache when it is fresh, in which
+        case only the other two ranges are requested.
+        
+        Args:
+            refresh_customers: Re-read customers even if the local cache is fresh
+            
+        Returns:
+            Tuple of (customers, task types, tasks header rows). The header rows are
+            None if the batch request failed and setup should read them itself.
+        """
+        cached_customers = None
+        if self.customer_cache_ttl > 0 and not refresh_customers:
+            cached_customers = self._load_cached_customers()
+        
+        ranges = [CUSTOMER_SHEET_RANGE, TASKTYPE_SHEET_RANGE, TASKS_HEADER_RANGE]
+        if cached_customers is not None:
+            ranges = ranges[1:]
+        
+        try:
+            logger.info("Prefetching %d ranges from spreadsheet", len(ranges))
+            value_ranges = self.sheets_client.batch_get(self.spreadsheet_id, ranges)
+        except Exception as e:
+            logger.error("Failed to prefetch spreadsheet data, reading ranges separately: %s", e)
+            return self.get_customers(refresh=refresh_customers), self.get_task_types(), None
+        
+        if cached_customers is not None:
+            logger.info("Using %d cached customers", len(cached_customers))
+            customers = cached_customers
+        else:
+            customers = self.get_customers(prefetched=value_ranges.pop(0))
+        tasktype_data, header_data = value_ranges
+        
+        return customers, self.get_task_types(prefetched=tasktype_data), header_data
+    
+    def get_customers(self, refresh: bool = False,
+                      prefetched: Optional[List[List[str]]] = None) -> List[Dict[str, str]]:
         """
         Retrieve all customers from the customer spreadsheet
         
+        When customer_cache_ttl is set, a fresh local cache is used instead of
+        reading the sheet.
+        
+        Args:
+            refresh: Re-read the sheet even if the local cache is fresh
+            prefetched: Rows of the customer range that were already fetched
+        
         Returns:
             List of customer dictionaries
         """
+        if self.customer_cache_ttl > 0 and not refresh and prefetched is None:
+            cached_customers = self._load_cached_customers()
+            if cached_customers is not None:
+                logger.info("Using %d cached customers", len(cached_customers))
+                return cached_customers
+        
         try:
-            logger.info("Retrieving customers from spreadsheet")
-            customers_data = self.sheets_client.read_sheet(self.spreadsheet_id, "Kunder!A:I")
-            
-            customers = []
-            
-            # Skip header row and process customer data
-            if customers_data and len(customers_data) > 1:
-                for row in customers_data[1:]:
-                    if row and len(row) >= 2:  # At least ID and name
-                        customer = {
-                            'id': row[0] if len(row) > 0 else '',
-                            'name': row[1] if len(row) > 1 else '',
-                            'address': row[2] if len(row) > 2 else '',
-                            'cvr': row[3] if len(row) > 3 else '',
-                            'zip': row[4] if len(row) > 4 else '',
-                            'town': row[5] if len(row) > 5 else '',
-                            'phone': row[6] if len(row) > 6 else '',
-                            'email': row[7] if len(row) > 7 else '',
-                            'hourly_rate': row[8] if len(row) > 8 else '0'
-                        }
-                        customers.append(customer)
-            
-            logger.info(f"Found {len(customers)} customers")
+            if prefetched is not None:
+                customer_rows = iter(prefetched)
+            else:
+                logger.info("Retrieving customers from spreadsheet")
+                customer_rows = self.sheets_client.stream_sheet(self.spreadsheet_id, CUSTOMER_SHEET_RANGE)
+            
+            # Skip header row and process customer data as it streams in.
+            # Short rows are padded with the column defaults; rows need at least ID and name.
+            next(customer_rows, None)
+            customers = [
+                dict(zip(CUSTOMER_FIELDS, row + CUSTOMER_DEFAULTS[len(row):]))
+                for row in customer_rows
+                if len(row) >= 2
+            ]
+            
+            logger.info("Found %d customers", len(customers))
+            if self.customer_cache_ttl > 0:
+                self._save_cached_customers(customers)
             return customers
             
         except Exception as e:
-            logger.error(f"Failed to retrieve customers: {e}")
+            logger.error("Failed to retrieve customers: %s", e)
             return []
     
-    def get_task_types(self) -> List[str]:
+    def get_task_types(self, refresh: bool = False,
+                       prefetched: Optional[List[List[str]]] = None) -> List[str]:
         """
         Retrieve task types from the task types spreadsheet
         
+        Args:
+            refresh: Re-read the sheet even if task types are already cached
+            prefetched: Rows of the task type range that were already fetched
+        
         Returns:
             List of task type strings
         """
+        if self._task_types_cache is not None and not refresh and prefetched is None:
+            return self._task_types_cache
+        
         try:
-            logger.info("Retrieving task types from spreadsheet")
-            tasktype_data = self.sheets_client.read_sheet(self.spreadsheet_id, "Tasktype!A:A")
+            if prefetched is not None:
+                tasktype_data = prefetched
+            else:
+                logger.info("Retrieving task types from spreadsheet")
+                tasktype_data = self.sheets_client.read_sheet(self.spreadsheet_id, TASKTYPE_SHEET_RANGE)
             
             task_types = []
             
             # Look for the "Tasktype" column and extract values
             if tasktype_data:
-                # Find the column index for "Tasktype"
-                header_row = tasktype_data[0] if tasktype_data else []
-                tasktype_col_index = None
-                
-                for i, header in enumerate(header_row):
-                    if header and 'tasktype' in header.lower():
-                        tasktype_col_index = i
-                        break
+                # Find the column index for "Tasktype", falling back to the first column
+                header_row = tasktype_data[0]
+                tasktype_col_index = next(
+                    (i for i, header in enumerate(header_row) if header and 'tasktype' in header.casefold()),
+                    0
+                )
                 
-                if tasktype_col_index is not None:
-                    # Extract task types from the found column
-                    for row in tasktype_data[1:]:  # Skip header
-                        if len(row) > tasktype_col_index and row[tasktype_col_index].strip():
-                            task_types.append(row[tasktype_col_index].strip())
-                else:
-                    # Fallback: assume first column contains task types
-                    for row in tasktype_data[1:]:
-                        if row and row[0].strip():
-                            task_types.append(row[0].strip())
+                # Skip header; each value is stripped only once
+                task_types = [
+                    task_type for row in tasktype_data[1:]
+                    if len(row) > tasktype_col_index and (task_type := row[tasktype_col_index].strip())
+                ]
             
-            logger.info(f"Found {len(task_types)} task types")
+            logger.info("Found %d task types", len(task_types))
+            self._task_types_cache = task_types
+            self._task_types_folded = {task_type.casefold() for task_type in task_types}
             return task_types
             
         except Exception as e:
-            logger.error(f"Failed to retrieve task types: {e}")
+            logger.error("Failed to retrieve task types: %s", e)
             return []
     
-    def add_new_task_type(self, new_task_type: str) -> bool:
+    def add_new_task_type(self, new_task_type: str,
+                          existing: Optional[List[str]] = None) -> Tuple[bool, List[str]]:
         """
         Add a new task type to the task types spreadsheet
         
         Args:
             new_task_type: The new task type to add
+            existing: Already fetched task types, used for the duplicate check
+                instead of re-reading the sheet and extended in place on success
             
         Returns:
-            True if successful, False otherwise
+            Tuple of (True if successful, task type list including the new type)
         """
+        logger.info("Adding new task type: %s", new_task_type)
+        # get_task_types logs and returns [] on errors, so this can't raise
+        existing_task_types = existing if existing is not None else self.get_task_types()
         try:
-            logger.info(f"Adding new task type: {new_task_type}")
-            
             # First, check if the task type already exists
-            existing_task_types = self.get_task_types()
-            if new_task_type.lower() in [task.lower() for task in existing_task_types]:
-                logger.warning(f"Task type '{new_task_type}' already exists")
-                return False
+            if existing_task_types is self._task_types_cache:
+                existing_folded = self._task_types_folded
+            else:
+                existing_folded = {task.casefold() for task in existing_task_types}
+            
+            if new_task_type.casefold() in existing_folded:
+                logger.warning("Task type '%s' already exists", new_task_type)
+                return False, existing_task_types
             
             # Add the new task type to the Tasktype sheet
             self.sheets_client.append_to_sheet(
                 self.spreadsheet_id,
-                "Tasktype!A:A",
+                TASKTYPE_SHEET_RANGE,
                 [[new_task_type]]
             )
+            if existing_task_types is not self._task_types_cache:
+                existing_task_types.append(new_task_type)
+            if self._task_types_cache is not None:
+                self._task_types_cache.append(new_task_type)
+                self._task_types_folded.add(new_task_type.casefold())
             
-            logger.info(f"Successfully added new task type: {new_task_type}")
-            return True
+            logger.info("Successfully added new task type: %s", new_task_type)
+            return True, existing_task_types
             
         except Exception as e:
-            logger.error(f"Failed to add new task type: {e}")
-            return False
+            logger.error("Failed to add new task type: %s", e)
+            return False, existing_task_types
 
     def add_task(self, task_data: Dict[str, str]) -> bool:
         """
         Add a new task to the tasks spreadsheet
         
+        The task is buffered and written once batch_size tasks are pending, so
+        with the default batch size of 1 it is written immediately.
+        
         Args:
             task_data: Dictionary containing task information
             
         Returns:
-            True if successful, False otherwise
+            True if the task was written, or queued when batch_size > 1 (see
+            pending_count), False otherwise
         """
         try:
             # Prepare task row with current date
-            current_date = datetime.now().strftime("%Y-%m-%d")
-            
             task_row = [
-                current_date,  # Date for creation of task
+                self.today,  # Date for creation of task
                 task_data['customer_name'],  # Customer name
                 task_data['tasktype'],  # Tasktype
                 task_data['pricing_type'],  # Pricing type (FixedPrice or HourlyPrice)
@@ -204,62 +356,165 @@ class TaskManager:
                 task_data['final_sum']  # Final sum after discount
             ]
             
-            logger.info(f"Adding new task for customer: {task_data['customer_name']}")
+            logger.info("Adding new task for customer: %s", task_data['customer_name'])
+            self._pending_tasks.append(task_row)
+            return self.flush()
+            
+        except Exception as e:
+            logger.error("Failed to add task: %s", e)
+            return False
+    
+    @property
+    def pending_count(self) -> int:
+        """Number of tasks queued by add_task that have not been written yet"""
+        return len(self._pending_tasks)
+    
+    def flush(self, force: bool = False) -> bool:
+        """
+        Append buffered tasks to the tasks spreadsheet in a single request
+        
+        Args:
+            force: Write pending tasks even if fewer than batch_size are buffered
+            
+        Returns:
+            True if nothing needed writing or the write succeeded, False otherwise
+        """
+        if not self._pending_tasks or (len(self._pending_tasks) < self.batch_size and not force):
+            return True
+        
+        try:
             self.sheets_client.append_to_sheet(
                 self.spreadsheet_id,
                 TASKS_SHEET_RANGE,
-                [task_row]
+                self._pending_tasks
             )
-            logger.info(f"Successfully added task: {task_data['description'][:50]}...")
+            logger.info("Successfully added %d task(s)", len(self._pending_tasks))
+            self._pending_tasks = []
             return True
             
         except Exception as e:
-            logger.error(f"Failed to add task: {e}")
+            logger.error("Failed to add tasks: %s", e)
             return False
     
-    def setup_tasks_spreadsheet_headers(self) -> None:
+    def setup_tasks_spreadsheet_headers(self, prefetched: Optional[List[List[str]]] = None) -> None:
         """
         Set up the tasks spreadsheet headers if they don't exist
+        
+        Args:
+            prefetched: Rows of the header range that were already fetched (see prefetch)
         """
         try:
             logger.info("Checking tasks spreadsheet headers")
-            tasks_data = self.sheets_client.read_sheet(self.spreadsheet_id, TASKS_SHEET_RANGE)
+            if prefetched is not None:
+                header_data = prefetched
+            else:
+                # Only the header row is needed; fetched via batchGet so further
+                # ranges can share the same round trip
+                header_data = self.sheets_client.batch_get(self.spreadsheet_id, [TASKS_HEADER_RANGE])[0]
             
-            headers = [
-                "Date", "Customer Name", "Tasktype", "Pricing Type", "Task Description", "Task Time (Minutes)", "Price", "Discount (%)", "Sum"
-            ]
+            pending_writes = []
+            
+            # If no data or headers don't match (including renamed columns), set them up
+            existing_headers = tuple(header_data[0]) if header_data else ()
+            if existing_headers != TASKS_HEADERS:
+                pending_writes.append({'range': TASKS_HEADER_RANGE, 'values': [list(TASKS_HEADERS)]})
             
-            # If no data or headers don't match, set them up
-            if not tasks_data or len(tasks_data[0]) != len(headers):
+            if pending_writes:
                 logger.info("Setting up tasks spreadsheet headers")
-                self.sheets_client.write_sheet(
-                    self.spreadsheet_id,
-                    "Opgave!A1:I1",
-                    [headers]
-                )
+                self.sheets_client.batch_update(self.spreadsheet_id, pending_writes)
                 logger.info("Tasks headers added successfully")
                 
         except Exception as e:
-            logger.error(f"Failed to setup tasks headers: {e}")
+            logger.error("Failed to setup tasks headers: %s", e)
 
 
-def display_customers(customers: List[Dict[str, str]]) -> None:
+def _format_customer_list(customers: List[Dict[str, str]]) -> str:
     """
-    Display available customers for selection
+    Format the numbered customer listing once so it can be redisplayed cheaply
     
     Args:
         customers: List of customer dictionaries
+        
+    Returns:
+        Preformatted listing with one entry (and optional town line) per customer
     """
-    print("\n" + "="*60)
-    print("AVAILABLE CUSTOMERS")
-    print("="*60)
-    
+    width = len(str(len(customers)))
+    town_indent = " " * (width + 3)
+    lines = []
     for i, customer in enumerate(customers, 1):
-        print(f"{i:2d}. {customer['name']} (ID: {customer['id']})")
+        lines.append(f"{i:{width}d}. {customer['name']} (ID: {customer['id']})")
         if customer['town']:
-            print(f"     {customer['town']}")
+            lines.append(f"{town_indent}{customer['town']}")
+    return "\n".join(lines)
+
+
+def display_customers(listing: str) -> None:
+    """
+    Display available customers for selection
     
-    print("="*60)
+    Args:
+        listing: Customer listing from _format_customer_list
+    """
+    # Written in one go instead of one print() per line, which is slow on
+    # Windows consoles for long listings
+    sys.stdout.write(f"\n{SEP}\nAVAILABLE CUSTOMERS\n{SEP}\n{listing}\n{SEP}\n")
+    sys.stdout.flush()
+
+
+def prompt(message: str) -> str:
+    """
+    Read one answer line from stdin
+    
+    Unlike input() this works line by line on any stdin, so a prepared answer
+    file (see --script) can drive the prompts non-interactively.
+    
+    Args:
+        message: Prompt text to display
+        
+    Returns:
+        The answer without its trailing newline
+        
+    Raises:
+        EOFError: If stdin has no more answers
+    """
+    sys.stdout.write(message)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError("No more input")
+    return line.rstrip("\r\n")
+
+
+def _use_fuzzy_picker() -> bool:
+    """Return True when the interactive prompt_toolkit picker can be used"""
+    return fuzzy_prompt is not None and sys.stdin.isatty()
+
+
+def fuzzy_select(label: str, options: List[str]) -> Optional[str]:
+    """
+    Let the user pick one of the options with fuzzy completion as they type
+    
+    Args:
+        label: Name of the thing being selected, used in the prompt
+        options: Option strings to choose from
+        
+    Returns:
+        The chosen option or None if cancelled
+    """
+    # Match against the whole line so multi-word names complete as one unit
+    completer = FuzzyCompleter(WordCompleter(options, sentence=True), pattern=r'^(.*)$')
+    valid_options = set(options)
+    
+    while True:
+        choice = fuzzy_prompt(f"\n{label} (type to search, 'q' to quit): ", completer=completer).strip()
+        
+        if choice.lower() in QUIT:
+            return None
+        
+        if choice in valid_options:
+            return choice
+        
+        print("❌ No matching entry. Please pick one of the suggestions.")
 
 
 def select_customer(customers: List[Dict[str, str]]) -> Optional[Dict[str, str]]:
@@ -276,46 +531,66 @@ def select_customer(customers: List[Dict[str, str]]) -> Optional[Dict[str, str]]
         print("❌ No customers available. Please add customers first using CreateCustomer.py")
         return None
     
-    display_customers(customers)
+    if _use_fuzzy_picker():
+        by_label = {f"{customer['name']} (ID: {customer['id']})": customer for customer in customers}
+        label = fuzzy_select("Customer", list(by_label))
+        if label is None:
+            return None
+        selected_customer = by_label[label]
+        print(f"\n✅ Selected: {selected_customer['name']}")
+        return selected_customer
+    
+    display_customers(_format_customer_list(customers))
     
     while True:
-        try:
-            selection = input(f"\nSelect customer (1-{len(customers)}) or 'q' to quit: ").strip()
-            
-            if selection.lower() == 'q':
-                return None
-            
-            customer_index = int(selection) - 1
-            
-            if 0 <= customer_index < len(customers):
-                selected_customer = customers[customer_index]
-                print(f"\n✅ Selected: {selected_customer['name']}")
-                return selected_customer
-            else:
-                print(f"❌ Invalid selection. Please enter a number between 1 and {len(customers)}")
-                
-        except ValueError:
+        selection = prompt(f"\nSelect customer (1-{len(customers)}) or 'q' to quit: ").strip()
+        
+        if selection.lower() in QUIT:
+            return None
+        
+        if not selection.isdecimal():
             print("❌ Invalid input. Please enter a number or 'q' to quit.")
+            continue
+        
+        customer_index = int(selection) - 1
+        
+        if 0 <= customer_index < len(customers):
+            selected_customer = customers[customer_index]
+            print(f"\n✅ Selected: {selected_customer['name']}")
+            return selected_customer
+        else:
+            print(f"❌ Invalid selection. Please enter a number between 1 and {len(customers)}")
 
 
-def display_task_types(task_types: List[str]) -> None:
+def _format_task_type_list(task_types: List[str]) -> str:
     """
-    Display available task types for selection
+    Format the numbered task type listing once so it can be redisplayed cheaply
     
     Args:
         task_types: List of task type strings
+        
+    Returns:
+        Preformatted listing ending with the create-new option
     """
-    print("\n" + "="*60)
-    print("AVAILABLE TASK TYPES")
-    print("="*60)
-    
-    for i, task_type in enumerate(task_types, 1):
-        print(f"{i:2d}. {task_type}")
+    width = len(str(len(task_types) + 1))
+    lines = [f"{i:{width}d}. {task_type}" for i, task_type in enumerate(task_types, 1)]
     
     # Add option to create new task type
-    print(f"{len(task_types) + 1:2d}. [CREATE NEW TASK TYPE]")
+    lines.append(f"{len(task_types) + 1:{width}d}. [CREATE NEW TASK TYPE]")
+    return "\n".join(lines)
+
+
+def display_task_types(listing: str) -> None:
+    """
+    Display available task types for selection
     
-    print("="*60)
+    Args:
+        listing: Task type listing from _format_task_type_list
+    """
+    # Written in one go instead of one print() per line, which is slow on
+    # Windows consoles for long listings
+    sys.stdout.write(f"\n{SEP}\nAVAILABLE TASK TYPES\n{SEP}\n{listing}\n{SEP}\n")
+    sys.stdout.flush()
 
 
 def select_task_type(task_types: List[str], task_manager: 'TaskManager') -> Optional[str]:
@@ -323,7 +598,8 @@ def select_task_type(task_types: List[str], task_manager: 'TaskManager') -> Opti
     Allow user to select a task type or create a new one
     
     Args:
-        task_types: List of available task types
+        task_types: List of available task types, extended in place if a new
+            task type is created
         task_manager: TaskManager instance for adding new task types
         
     Returns:
@@ -331,66 +607,79 @@ def select_task_type(task_types: List[str], task_manager: 'TaskManager') -> Opti
     """
     if not task_types:
         print("❌ No task types available. You can create a new one.")
-        task_types = []  # Empty list to show create option
     
-    display_task_types(task_types)
+    if _use_fuzzy_picker():
+        create_option = "[CREATE NEW TASK TYPE]"
+        selected_tasktype = fuzzy_select("Task type", task_types + [create_option])
+        if selected_tasktype == create_option:
+            new_task_type, _ = create_new_task_type(task_manager, task_types)
+            return new_task_type
+        if selected_tasktype is not None:
+            print(f"\n✅ Selected: {selected_tasktype}")
+        return selected_tasktype
+    
+    display_task_types(_format_task_type_list(task_types))
     
     while True:
-        try:
-            max_selection = len(task_types) + 1  # +1 for "Create New" option
-            selection = input(f"\nSelect task type (1-{max_selection}) or 'q' to quit: ").strip()
-            
-            if selection.lower() == 'q':
-                return None
-            
-            tasktype_index = int(selection) - 1
-            
-            # Check if user selected an existing task type
-            if 0 <= tasktype_index < len(task_types):
-                selected_tasktype = task_types[tasktype_index]
-                print(f"\n✅ Selected: {selected_tasktype}")
-                return selected_tasktype
-            
-            # Check if user selected "Create New" option
-            elif tasktype_index == len(task_types):  # Create new option
-                return create_new_task_type(task_manager)
-            
-            else:
-                print(f"❌ Invalid selection. Please enter a number between 1 and {max_selection}")
-                
-        except ValueError:
+        max_selection = len(task_types) + 1  # +1 for "Create New" option
+        selection = prompt(f"\nSelect task type (1-{max_selection}) or 'q' to quit: ").strip()
+        
+        if selection.lower() in QUIT:
+            return None
+        
+        if not selection.isdecimal():
             print("❌ Invalid input. Please enter a number or 'q' to quit.")
+            continue
+        
+        tasktype_index = int(selection) - 1
+        
+        # Check if user selected an existing task type
+        if 0 <= tasktype_index < len(task_types):
+            selected_tasktype = task_types[tasktype_index]
+            print(f"\n✅ Selected: {selected_tasktype}")
+            return selected_tasktype
+        
+        # Check if user selected "Create New" option
+        elif tasktype_index == len(task_types):  # Create new option
+            new_task_type, _ = create_new_task_type(task_manager, task_types)
+            return new_task_type
+        
+        else:
+            print(f"❌ Invalid selection. Please enter a number between 1 and {max_selection}")
 
 
-def create_new_task_type(task_manager: 'TaskManager') -> Optional[str]:
+def create_new_task_type(task_manager: 'TaskManager',
+                         existing: Optional[List[str]] = None) -> Tuple[Optional[str], List[str]]:
     """
     Create a new task type
     
     Args:
         task_manager: TaskManager instance for adding the new task type
+        existing: Already fetched task types, passed on for the duplicate check
         
     Returns:
-        New task type string or None if cancelled
+        Tuple of (new task type string or None if cancelled, updated task type list)
     """
-    print("\n" + "="*60)
-    print("CREATE NEW TASK TYPE")
-    print("="*60)
+    task_types = existing if existing is not None else []
+
+    print(f"\n{SEP}\nCREATE NEW TASK TYPE\n{SEP}")
     
     while True:
-        new_task_type = input("Enter new task type name (or 'q' to quit): ").strip()
+        new_task_type = prompt("Enter new task type name (or 'q' to quit): ").strip()
         
-        if new_task_type.lower() == 'q':
-            return None
+        if new_task_type.lower() in QUIT:
+            return None, task_types
         
         if new_task_type:
             # Confirm the new task type
             print(f"\nNew task type: '{new_task_type}'")
-            confirm = input("Add this task type? (y/N): ").strip().lower()
+            confirm = prompt("Add this task type? (y/N): ").strip().lower()
             
-            if confirm == 'y':
-                if task_manager.add_new_task_type(new_task_type):
+            if confirm in YES:
+                added, task_types = task_manager.add_new_task_type(new_task_type, existing=existing)
+                if added:
                     print(f"\n✅ Task type '{new_task_type}' created successfully!")
-                    return new_task_type
+                    return new_task_type, task_types
                 else:
                     print(f"\n❌ Failed to create task type. It may already exist.")
                     continue
@@ -407,9 +696,7 @@ def select_pricing_type() -> Optional[str]:
     Returns:
         Pricing type string or None if cancelled
     """
-    print("\n" + "="*60)
-    print("PRICING TYPE SELECTION")
-    print("="*60)
+    print(f"\n{SEP}\nPRICING TYPE SELECTION\n{SEP}")
     print("Choose pricing type:")
     print("1. FixedPrice - Set a fixed price for this task")
     print("2. HourlyPrice - Price based on hourly rate and time spent")
@@ -417,9 +704,9 @@ def select_pricing_type() -> Optional[str]:
     
     while True:
         try:
-            choice = input("\nEnter your choice (1-2 or 'q'): ").strip().lower()
+            choice = prompt("\nEnter your choice (1-2 or 'q'): ").strip().lower()
             
-            if choice == 'q':
+            if choice in QUIT:
                 return None
             elif choice == '1':
                 return 'FixedPrice'
@@ -440,15 +727,13 @@ def get_fixed_price() -> Optional[float]:
     Returns:
         Fixed price amount or None if cancelled
     """
-    print("\n" + "="*60)
-    print("FIXED PRICE")
-    print("="*60)
+    print(f"\n{SEP}\nFIXED PRICE\n{SEP}")
     
     while True:
         try:
-            price_input = input("Enter fixed price (DKK) (or 'q' to quit): ").strip()
+            price_input = prompt("Enter fixed price (DKK) (or 'q' to quit): ").strip()
             
-            if price_input.lower() == 'q':
+            if price_input.lower() in QUIT:
                 return None
             
             price = float(price_input)
@@ -473,18 +758,20 @@ def get_hourly_usage() -> Optional[int]:
     Returns:
         Time in minutes or None if cancelled
     """
-    print("\n" + "="*60)
-    print("HOURLY USAGE")
-    print("="*60)
+    print(f"\n{SEP}\nHOURLY USAGE\n{SEP}")
     print("Enter the time spent on this task:")
     
     while True:
         try:
-            time_input = input("Time in minutes (or 'q' to quit): ").strip()
+            time_input = prompt("Time in minutes (or 'q' to quit): ").strip()
             
-            if time_input.lower() == 'q':
+            if time_input.lower() in QUIT:
                 return None
             
+            if not time_input.isdecimal():
+                print("❌ Invalid time format. Please enter a whole number of minutes.")
+                continue
+            
             minutes = int(time_input)
             
             if minutes <= 0:
@@ -503,8 +790,6 @@ def get_hourly_usage() -> Optional[int]:
             print(f"📊 Time entered: {minutes} minutes ({time_display})")
             return minutes
             
-        except ValueError:
-            print("❌ Invalid time format. Please enter a whole number of minutes.")
         except KeyboardInterrupt:
             print("\n\n⏭️ Task creation cancelled.")
             return None
@@ -517,14 +802,12 @@ def get_task_description() -> Optional[str]:
     Returns:
         Task description string or None if cancelled
     """
-    print("\n" + "="*60)
-    print("TASK DESCRIPTION")
-    print("="*60)
+    print(f"\n{SEP}\nTASK DESCRIPTION\n{SEP}")
     
     while True:
-        description = input("Enter task description (or 'q' to quit): ").strip()
+        description = prompt("Enter task description (or 'q' to quit): ").strip()
         
-        if description.lower() == 'q':
+        if description.lower() in QUIT:
             return None
         
         if description:
@@ -540,26 +823,24 @@ def get_task_time() -> Optional[int]:
     Returns:
         Task time in minutes or None if cancelled
     """
-    print("\n" + "="*60)
-    print("TASK TIME")
-    print("="*60)
+    print(f"\n{SEP}\nTASK TIME\n{SEP}")
     
     while True:
-        try:
-            time_input = input("Enter task time in minutes (or 'q' to quit): ").strip()
-            
-            if time_input.lower() == 'q':
-                return None
-            
-            time_minutes = int(time_input)
-            
-            if time_minutes > 0:
-                return time_minutes
-            else:
-                print("❌ Task time must be greater than 0 minutes.")
-                
-        except ValueError:
+        time_input = prompt("Enter task time in minutes (or 'q' to quit): ").strip()
+        
+        if time_input.lower() in QUIT:
+            return None
+        
+        if not time_input.isdecimal():
             print("❌ Invalid input. Please enter a valid number of minutes.")
+            continue
+        
+        time_minutes = int(time_input)
+        
+        if time_minutes > 0:
+            return time_minutes
+        else:
+            print("❌ Task time must be greater than 0 minutes.")
 
 
 def get_discount_percentage() -> Optional[float]:
@@ -569,15 +850,13 @@ def get_discount_percentage() -> Optional[float]:
     Returns:
         Discount percentage (0.0-100.0) or None if cancelled
     """
-    print("\n" + "="*60)
-    print("DISCOUNT PERCENTAGE")
-    print("="*60)
+    print(f"\n{SEP}\nDISCOUNT PERCENTAGE\n{SEP}")
     
     while True:
         try:
-            discount_input = input("Enter discount percentage (0-100) or press Enter for 0% (or 'q' to quit): ").strip()
+            discount_input = prompt("Enter discount percentage (0-100) or press Enter for 0% (or 'q' to quit): ").strip()
             
-            if discount_input.lower() == 'q':
+            if discount_input.lower() in QUIT:
                 return None
             
             # If empty, default to 0%
@@ -595,18 +874,17 @@ def get_discount_percentage() -> Optional[float]:
             print("❌ Invalid input. Please enter a valid number.")
 
 
-def display_task_summary(task_data: Dict[str, str]) -> None:
+def display_task_summary(task_data: Dict[str, str], today: str) -> None:
     """
     Display task data summary for confirmation
     
     Args:
         task_data: Dictionary containing task information
+        today: Date the task will be stamped with (YYYY-MM-DD)
     """
-    print("\n" + "="*60)
-    print("TASK INFORMATION SUMMARY")
-    print("="*60)
+    print(f"\n{SEP}\nTASK INFORMATION SUMMARY\n{SEP}")
     
-    print(f"Date:             {datetime.now().strftime('%Y-%m-%d')}")
+    print(f"Date:             {today}")
     print(f"Customer:         {task_data['customer_name']}")
     print(f"Task Type:        {task_data['tasktype']}")
     print(f"Pricing Type:     {task_data['pricing_type']}")
@@ -618,12 +896,62 @@ def display_task_summary(task_data: Dict[str, str]) -> None:
     print(f"Price:            {task_data['calculated_price']} DKK")
     print(f"Discount:         {task_data['discount_percentage']}%")
     print(f"Final Sum:        {task_data['final_sum']} DKK")
-    print("="*60)
+    print(SEP)
 
 
-def main() -> None:
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command line arguments
+    
+    Args:
+        argv: Arguments to parse (defaults to sys.argv[1:])
+        
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Create a new ST_Faktura task")
+    parser.add_argument(
+        "--refresh-customers",
+        action="store_true",
+        help="Ignore the local customer cache and re-read the Kunder sheet"
+    )
+    parser.add_argument(
+        "--script",
+        metavar="FILE",
+        help="Read prompt answers from FILE, one per line, instead of the keyboard"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
     """
     Main function for task creation
+    
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+    """
+    args = parse_args(argv)
+    
+    if not args.script:
+        _create_task(args)
+        return
+    
+    # Answer the prompts from a prepared file for non-interactive runs
+    with open(args.script, 'r', encoding='utf-8') as script:
+        original_stdin = sys.stdin
+        sys.stdin = script
+        try:
+            _create_task(args)
+        finally:
+            sys.stdin = original_stdin
+
+
+def _create_task(args: argparse.Namespace) -> None:
+    """
+    Run the interactive task creation flow
+    
+    Args:
+        args: Parsed command line arguments
     """
     logger.info("Starting ST_Faktura Task Creation")
     
@@ -634,18 +962,18 @@ def main() -> None:
         client = GoogleSheetsClient(auth_method=auth_method, config=config)
         
         # Initialize task manager
-        task_manager = TaskManager(client)
+        task_manager = TaskManager(client, customer_cache_ttl=CUSTOMER_CACHE_TTL)
+        
+        # Fetch customers, task types and the tasks header row in one request
+        customers, task_types, header_data = task_manager.prefetch(refresh_customers=args.refresh_customers)
         
         # Setup tasks spreadsheet headers if needed
-        task_manager.setup_tasks_spreadsheet_headers()
+        task_manager.setup_tasks_spreadsheet_headers(prefetched=header_data)
         
-        print("\n" + "="*60)
-        print("ST_FAKTURA - NEW TASK CREATION")
-        print("="*60)
+        print(f"\n{SEP}\nST_FAKTURA - NEW TASK CREATION\n{SEP}")
         
         # Step 1: Select customer
         print("\nStep 1: Select Customer")
-        customers = task_manager.get_customers()
         selected_customer = select_customer(customers)
         
         if not selected_customer:
@@ -654,7 +982,6 @@ def main() -> None:
         
         # Step 2: Select task type (with option to create new)
         print("\nStep 2: Select Task Type")
-        task_types = task_manager.get_task_types()
         selected_tasktype = select_task_type(task_types, task_manager)
         
         if not selected_tasktype:
@@ -732,11 +1059,11 @@ def main() -> None:
         }
         
         # Display summary and confirm
-        display_task_summary(task_data)
+        display_task_summary(task_data, task_manager.today)
         
-        confirm = input("\nDo you want to save this task? (y/N): ").strip().lower()
+        confirm = prompt("\nDo you want to save this task? (y/N): ").strip().lower()
         
-        if confirm == 'y':
+        if confirm in YES:
             # Add task to spreadsheet
             if task_manager.add_task(task_data):
                 print(f"\n✅ Task added successfully!")
@@ -753,7 +1080,7 @@ def main() -> None:
                 if discount_percentage > 0:
                     print(f"Discount: {discount_percentage}%")
                     print(f"Final Sum: {final_sum} DKK")
-                logger.info(f"Task creation completed for customer: {selected_customer['name']}")
+                logger.info("Task creation completed for customer: %s", selected_customer['name'])
             else:
                 print(f"\n❌ Failed to add task. Please check the logs for details.")
                 sys.exit(1)
@@ -766,8 +1093,13 @@ def main() -> None:
         logger.info("Task creation interrupted by user")
         sys.exit(0)
     
+    except EOFError:
+        print("\n\n⏭️ No more input, task creation cancelled.")
+        logger.info("Task creation stopped at end of input")
+        sys.exit(0)
+    
     except Exception as e:
-        logger.error(f"Unexpected error in task creation: {e}")
+        logger.error("Unexpected error in task creation: %s", e)
         print(f"\n❌ An unexpected error occurred: {e}")
         sys.exit(1)
 
@@ -8,33 +8,200 @@ Following copilot instructions for cross-platform compatibility, proper logging,
 """
 
 import os
+import re
 import json
+import hashlib
 import logging
 import sys
-from typing import Dict, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property
+from operator import itemgetter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from dotenv import load_dotenv
-from google_sheets_client import GoogleSheetsClient
+
+from file_utils import atomic_write_bytes
+
+if TYPE_CHECKING:
+    from google_sheets_client import GoogleSheetsClient
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+try:
+    from prompt_toolkit import prompt as form_prompt
+    from prompt_toolkit.history import InMemoryHistory
+except ImportError:  # prompt_toolkit is optional; fall back to input()
+    form_prompt = None
 
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, os.getenv('LOG_LEVEL', 'INFO')),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('st_faktura_company.log'),
-        logging.StreamHandler()
-    ]
-)
+# Logging level from LOG_LEVEL, falling back to INFO for unknown names
+_LEVELS = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL
+}
+LOG_LEVEL = _LEVELS.get(os.getenv('LOG_LEVEL', 'INFO').upper(), logging.INFO)
+
+# Handlers (and the log file) are only set up when the tool runs, see
+# _configure_logging, so importing this module has no side effects
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+def _configure_logging() -> None:
+    """Configure console and file logging for the company details tool"""
+    logging.basicConfig(
+        level=LOG_LEVEL,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('st_faktura_company.log'),
+            logging.StreamHandler()
+        ]
+    )
+
+# Separator line used around the CLI screens
+SEP = "=" * 60
+
+# Company summary screen, filled in with %-formatting from the details dict
+_SUMMARY_TEMPLATE = "\n".join([
+    "",
+    SEP,
+    "COMPANY INFORMATION SUMMARY",
+    SEP,
+    "Company Name:     %(company_name)s",
+    "Company Address:  %(company_address)s",
+    "Company CVR:      %(company_cvr)s",
+    "Company Zip:      %(company_zip)s",
+    "Company Town:     %(company_town)s",
+    "Company Phone:    %(company_phone)s",
+    "Company Email:    %(company_email)s",
+    "",
+    "--- Banking Information ---",
+    "Bank Name:        %(bank_name)s",
+    "Bank Account:     %(bank_account)s",
+    "IBAN:             %(iban)s",
+    "SWIFT:            %(swift)s",
+    "",
+    "--- Additional Information ---",
+    "Additional Info:  %(additional_info)s",
+    SEP,
+    "",
+])
 
 # Company details file path (cross-platform)
 COMPANY_DETAILS_FILE = os.path.join(os.getcwd(), 'st-faktura.json')
 
+# Company saves that could not be written to Google Sheets, one JSON object
+# per line; replayed on the next run
+PENDING_SHEETS_FILE = os.path.join(os.getcwd(), 'pending_sheets.jsonl')
+
+# Sidecar file remembering which spreadsheets already have verified headers
+COMPANY_CACHE_FILE = os.path.join(os.getcwd(), '.st-faktura-cache.json')
+
 # Google Sheets configuration
 SPREADSHEET_ID = "170onDFFCveCzV6Q9F1_IhsG2LBRcw5MYxJbyocVJmq0"
 COMPANY_SHEET_RANGE = "Company Details!A:N"  # Assuming columns A-N for all company data
+COMPANY_HEADER_RANGE = "Company Details!A1:L1"
+COMPANY_ROW_RANGE = "Company Details!A2:L2"
+# Fields that must be filled in before company details can be saved
+REQUIRED_FIELDS = (
+    'company_name', 'company_address', 'company_cvr',
+    'company_zip', 'company_town', 'company_phone',
+    'company_email', 'bank_name', 'bank_account', 'iban', 'swift'
+)
+
+# Format checks for filled-in fields: (field, compiled pattern, error message).
+# Values are matched with spaces removed and uppercased, so "DK50 0040 ..." IBANs pass.
+_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+_CVR_RE = re.compile(r'^\d{8}$')
+_ZIP_RE = re.compile(r'^\d{4}$')
+_IBAN_RE = re.compile(r'^[A-Z]{2}\d{2}[A-Z0-9]+$')
+_VALIDATORS = (
+    ('company_email', _EMAIL_RE, "Invalid email format"),
+    ('company_cvr', _CVR_RE, "Invalid CVR number (expected 8 digits)"),
+    ('company_zip', _ZIP_RE, "Invalid zip code (expected 4 digits)"),
+    ('iban', _IBAN_RE, "Invalid IBAN format"),
+)
+
+# Company detail keys in sheet column order (matches COMPANY_HEADERS);
+# additional_info is optional and read separately with a default
+_FIELD_ORDER = (
+    'company_name', 'company_address', 'company_cvr', 'company_zip',
+    'company_town', 'company_phone', 'company_email', 'bank_name',
+    'bank_account', 'iban', 'swift', 'additional_info'
+)
+_ROW_GETTER = itemgetter(*_FIELD_ORDER[:-1])
+
+COMPANY_HEADERS = [
+    "Company Name", "Address", "CVR", "Zip Code", "Town", "Phone",
+    "Email", "Bank Name", "Bank Account", "IBAN", "SWIFT", "Additional Information"
+]
+
+
+def normalize_company_details(company_details: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Canonicalize company details once at the input boundary
+    
+    The manager methods expect this shape: every value is a str with
+    surrounding whitespace removed (None becomes '').
+    
+    Args:
+        company_details: Raw company details, e.g. from user input or an API payload
+        
+    Returns:
+        New dictionary with stripped string values
+    """
+    return {key: str(value).strip() if value is not None else '' for key, value in company_details.items()}
+
+
+def _company_row(company_details: Dict[str, str]) -> List[str]:
+    """
+    Build the sheet row for a company in COMPANY_HEADERS column order
+    
+    Args:
+        company_details: Dictionary containing company information
+        
+    Returns:
+        List of cell values
+    """
+    return [*_ROW_GETTER(company_details), company_details.get('additional_info', '')]
+
+
+def _loads_json(data: bytes) -> Any:
+    """
+    Decode JSON bytes, using orjson when it is installed
+    
+    Args:
+        data: UTF-8 encoded JSON document
+        
+    Returns:
+        Decoded JSON value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _dumps_json(obj: Any) -> bytes:
+    """
+    Encode a value as indented UTF-8 JSON, using orjson when it is installed
+    
+    Args:
+        obj: Value to encode
+        
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
 
 
 class CompanyDetailsManager:
@@ -42,16 +209,35 @@ class CompanyDetailsManager:
     Manages company details following clean architecture principles
     """
     
-    def __init__(self, config_file: str = COMPANY_DETAILS_FILE):
+    # Single background worker for Google Sheets saves, so they run in order
+    _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='company-sheets')
+    
+    def __init__(self, config_file: str = COMPANY_DETAILS_FILE, cache_file: str = COMPANY_CACHE_FILE):
         """
         Initialize company details manager
         
         Args:
             config_file: Path to the company details configuration file
+            cache_file: Path to the local sheet state cache
         """
         self.config_file = config_file
-        self.sheets_client = GoogleSheetsClient()
+        self.cache_file = cache_file
+        # JSON copy of config_file stamped with its mtime and size, reused while config_file is unchanged
+        self.compiled_cache_file = os.path.splitext(config_file)[0] + '.cache'
         self.spreadsheet_id = SPREADSHEET_ID
+    
+    @cached_property
+    def sheets_client(self) -> 'GoogleSheetsClient':
+        """
+        Google Sheets client, created on first use
+        
+        The Google API libraries are only imported (and credentials only
+        loaded) when a Sheets call is actually made, which keeps local-only
+        runs of this tool fast to start.
+        """
+        from google_sheets_client import GoogleSheetsClient
+        
+        return GoogleSheetsClient()
         
     def load_company_details(self) -> Optional[Dict[str, str]]:
         """
@@ -60,11 +246,15 @@ class CompanyDetailsManager:
         Returns:
             Dictionary containing company details or None if not found
         """
+        config_path = Path(self.config_file)
         try:
-            if os.path.exists(self.config_file):
+            if config_path.exists():
                 logger.info(f"Loading company details from {self.config_file}")
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    company_details = json.load(f)
+                source_stat = config_path.stat()
+                company_details = self._load_compiled_cache(source_stat)
+                if company_details is None:
+                    company_details = _loads_json(config_path.read_bytes())
+                    self._write_compiled_cache(source_stat, company_details)
                 logger.info("Company details loaded successfully")
                 return company_details
             else:
@@ -75,6 +265,52 @@ class CompanyDetailsManager:
             logger.error(f"Failed to load company details: {e}")
             return None
     
+    def _load_compiled_cache(self, source_stat: os.stat_result) -> Optional[Dict[str, str]]:
+        """
+        Load company details from the compiled cache if it matches the JSON file
+        
+        The cache is plain JSON (never pickle, as it sits in the working
+        directory) stamped with the source file's mtime and size.
+        
+        Args:
+            source_stat: os.stat result of the company details JSON file
+            
+        Returns:
+            Cached company details or None if the cache is missing or stale
+        """
+        try:
+            cache = _loads_json(Path(self.compiled_cache_file).read_bytes())
+            if (cache['mtime_ns'], cache['size']) != (source_stat.st_mtime_ns, source_stat.st_size):
+                return None
+            company_details = cache['details']
+            if not isinstance(company_details, dict):
+                return None
+            logger.debug("Using compiled company details cache")
+            return company_details
+        except Exception:
+            # A missing, truncated or foreign cache just means parsing the JSON again
+            return None
+    
+    def _write_compiled_cache(self, source_stat: os.stat_result, company_details: Dict[str, str]) -> None:
+        """
+        Store company details in the compiled cache for the next load
+        
+        Args:
+            source_stat: os.stat result of the JSON file the details were read from
+            company_details: Dictionary containing company information
+        """
+        try:
+            atomic_write_bytes(
+                self.compiled_cache_file,
+                _dumps_json({
+                    'mtime_ns': source_stat.st_mtime_ns,
+                    'size': source_stat.st_size,
+                    'details': company_details,
+                })
+            )
+        except OSError as e:
+            logger.warning(f"Failed to write compiled company details cache: {e}")
+    
     def save_company_details(self, company_details: Dict[str, str]) -> bool:
         """
         Save company details to file
@@ -88,11 +324,11 @@ class CompanyDetailsManager:
         try:
             logger.info(f"Saving company details to {self.config_file}")
             
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
+            # Ensure directory exists (a bare file name has no directory part)
+            if config_dir := os.path.dirname(self.config_file):
+                os.makedirs(config_dir, exist_ok=True)
             
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(company_details, f, indent=2, ensure_ascii=False)
+            atomic_write_bytes(self.config_file, _dumps_json(company_details))
             
             logger.info("Company details saved successfully")
             return True
@@ -106,34 +342,94 @@ class CompanyDetailsManager:
         Validate company details
         
         Args:
-            company_details: Dictionary containing company information
+            company_details: Dictionary containing company information, already
+                normalized with normalize_company_details
             
         Returns:
             List of validation errors (empty if valid)
         """
-        errors = []
+        errors = [
+            f"Missing required field: {field}" for field in REQUIRED_FIELDS
+            if not company_details.get(field, '')
+        ]
         
-        required_fields = [
-            'company_name', 'company_address', 'company_cvr', 
-            'company_zip', 'company_town', 'company_phone', 
-            'company_email', 'bank_name', 'bank_account', 'iban', 'swift'
+        # Validate field formats
+        errors += [
+            message for field, pattern, message in _VALIDATORS
+            if (value := company_details.get(field, '').replace(' ', '').upper())
+            and not pattern.match(value)
         ]
         
-        for field in required_fields:
-            if not company_details.get(field, '').strip():
-                errors.append(f"Missing required field: {field}")
+        return errors
+    
+    def is_company_details_valid(self, company_details: Dict[str, str]) -> bool:
+        """
+        Check company details, stopping at the first problem
         
-        # Validate email format (basic validation)
-        email = company_details.get('company_email', '').strip()
-        if email and '@' not in email:
-            errors.append("Invalid email format")
+        Use validate_company_details to get the full list of errors for display.
         
-        return errors
+        Args:
+            company_details: Dictionary containing company information, already
+                normalized with normalize_company_details
+            
+        Returns:
+            True if all required fields are filled and have a valid format
+        """
+        return (
+            all(company_details.get(field, '') for field in REQUIRED_FIELDS)
+            and all(
+                pattern.match(company_details.get(field, '').replace(' ', '').upper())
+                for field, pattern, _ in _VALIDATORS
+            )
+        )
+    
+    def _headers_cache_key(self) -> str:
+        """
+        Build the cache key for the header state of the company sheet
+        
+        The key includes a hash of the header range and names, so changing
+        either constant invalidates the cached state.
+        
+        Returns:
+            Cache key string
+        """
+        layout = "\t".join([COMPANY_HEADER_RANGE] + COMPANY_HEADERS)
+        digest = hashlib.sha1(layout.encode('utf-8')).hexdigest()[:12]
+        return f"{self.spreadsheet_id}:{digest}"
+    
+    def _load_sheet_cache(self) -> Dict[str, bool]:
+        """
+        Load the local sheet state cache
+        
+        Returns:
+            Dictionary of cache keys to verified flags (empty if missing or unreadable)
+        """
+        try:
+            return _loads_json(Path(self.cache_file).read_bytes()).get('headers_verified', {})
+        except (OSError, ValueError, AttributeError):
+            return {}
+    
+    def _headers_verified(self) -> bool:
+        """Return True if the company sheet headers are known to be in place"""
+        return self._load_sheet_cache().get(self._headers_cache_key(), False)
+    
+    def _mark_headers_verified(self) -> None:
+        """Remember that the company sheet headers are in place"""
+        verified = self._load_sheet_cache()
+        verified[self._headers_cache_key()] = True
+        try:
+            atomic_write_bytes(self.cache_file, _dumps_json({'headers_verified': verified}))
+        except OSError as e:
+            logger.warning(f"Failed to update sheet cache: {e}")
     
     def save_to_google_sheets(self, company_details: Dict[str, str]) -> bool:
         """
         Save company details to Google Sheets
         
+        The sheet holds one company: the header row and the company row (row 2)
+        are upserted together in a single batchUpdate request, without reading
+        the sheet first. Use save_companies_to_google_sheets to add rows instead.
+        
         Args:
             company_details: Dictionary containing company information
             
@@ -143,83 +439,180 @@ class CompanyDetailsManager:
         try:
             logger.info("Saving company details to Google Sheets")
             
-            # Set up headers if needed
-            self.setup_company_sheet_headers()
+            self.sheets_client.batch_update(
+                self.spreadsheet_id,
+                [
+                    {'range': COMPANY_HEADER_RANGE, 'values': [COMPANY_HEADERS]},
+                    {'range': COMPANY_ROW_RANGE, 'values': [_company_row(company_details)]}
+                ]
+            )
+            self._mark_headers_verified()
+            # The row now holds these details; an older queued save must not overwrite them
+            self._clear_pending_saves()
             
-            # Prepare company data row
-            company_row = [
-                company_details['company_name'],
-                company_details['company_address'],
-                company_details['company_cvr'],
-                company_details['company_zip'],
-                company_details['company_town'],
-                company_details['company_phone'],
-                company_details['company_email'],
-                company_details['bank_name'],
-                company_details['bank_account'],
-                company_details['iban'],
-                company_details['swift'],
-                company_details.get('additional_info', '')
-            ]
+            logger.info("Company details saved to Google Sheets successfully")
+            return True
             
-            # Check if company already exists and update, or append new
-            existing_data = self.sheets_client.read_sheet(self.spreadsheet_id, COMPANY_SHEET_RANGE)
+        except Exception as e:
+            logger.error(f"Failed to save company details to Google Sheets: {e}")
+            return False
+    
+    def save_to_google_sheets_async(self, company_details: Dict[str, str]) -> 'Future[bool]':
+        """
+        Save company details to Google Sheets in the background
+        
+        Transient API errors (including 429 rate limits) are retried with
+        backoff by the Sheets client. If the save still fails, the details are
+        queued in PENDING_SHEETS_FILE for replay_pending_saves.
+        
+        Args:
+            company_details: Dictionary containing company information
             
-            if existing_data and len(existing_data) > 1:
-                # Update existing row (assume row 2 is the data row)
-                logger.info("Updating existing company details in sheet")
-                self.sheets_client.write_sheet(
-                    self.spreadsheet_id,
-                    "Company Details!A2:L2",
-                    [company_row]
-                )
-            else:
-                # Append new row
-                logger.info("Adding new company details to sheet")
-                self.sheets_client.append_to_sheet(
-                    self.spreadsheet_id,
-                    COMPANY_SHEET_RANGE,
-                    [company_row]
-                )
+        Returns:
+            Future resolving to True if the save succeeded, False otherwise
+        """
+        return self._executor.submit(self._save_or_queue, dict(company_details))
+    
+    def _save_or_queue(self, company_details: Dict[str, str]) -> bool:
+        """Save to Google Sheets, queueing the details for later on failure"""
+        saved = self.save_to_google_sheets(company_details)
+        if not saved:
+            self._queue_pending_save(company_details)
+        return saved
+    
+    def _queue_pending_save(self, company_details: Dict[str, str]) -> None:
+        """
+        Queue company details for a later Google Sheets save
+        
+        Every save writes the same sheet row, so only the latest details are
+        kept; they replace anything queued before.
+        
+        Args:
+            company_details: Dictionary containing company information
+        """
+        try:
+            atomic_write_bytes(
+                PENDING_SHEETS_FILE,
+                (json.dumps(company_details, ensure_ascii=False) + '\n').encode('utf-8')
+            )
+            logger.warning(f"Queued company details for a later Google Sheets save in {PENDING_SHEETS_FILE}")
+        except OSError as e:
+            logger.error(f"Failed to queue pending Google Sheets save: {e}")
+    
+    def _clear_pending_saves(self) -> None:
+        """Drop any queued Google Sheets save"""
+        try:
+            os.remove(PENDING_SHEETS_FILE)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Failed to clear pending Google Sheets saves: {e}")
+    
+    def replay_pending_saves(self) -> int:
+        """
+        Retry the Google Sheets save queued by an earlier run
+        
+        Only the latest queued details are written (files from older versions
+        may hold several); if that save fails again it stays queued.
+        
+        Returns:
+            Number of queued saves that were written successfully (0 or 1)
+        """
+        try:
+            with open(PENDING_SHEETS_FILE, 'r', encoding='utf-8') as f:
+                pending = [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to read pending Google Sheets saves: {e}")
+            return 0
+        
+        if not pending:
+            self._clear_pending_saves()
+            return 0
+        
+        logger.info("Replaying pending Google Sheets save")
+        return 1 if self._save_or_queue(pending[-1]) else 0
+    
+    def replay_pending_saves_async(self) -> 'Future[int]':
+        """
+        Run replay_pending_saves on the background worker
+        
+        Returns:
+            Future resolving to the number of queued saves that were written
+        """
+        return self._executor.submit(self.replay_pending_saves)
+    
+    def save_companies_to_google_sheets(self, companies: List[Dict[str, str]]) -> bool:
+        """
+        Append several companies to Google Sheets in a single request
+        
+        Intended for bulk imports; each company becomes a new row.
+        
+        Args:
+            companies: Dictionaries containing company information
             
-            logger.info("Company details saved to Google Sheets successfully")
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            logger.info(f"Appending {len(companies)} companies to Google Sheets")
+            self.setup_company_sheet_headers()
+            self.sheets_client.append_rows(
+                self.spreadsheet_id,
+                COMPANY_SHEET_RANGE,
+                (_company_row(company) for company in companies)
+            )
+            logger.info("Companies appended to Google Sheets successfully")
             return True
             
         except Exception as e:
-            logger.error(f"Failed to save company details to Google Sheets: {e}")
+            logger.error(f"Failed to append companies to Google Sheets: {e}")
             return False
     
     def setup_company_sheet_headers(self) -> None:
         """
         Set up the company sheet headers if they don't exist
+        
+        The check is skipped when the local cache says the headers were already
+        verified for this spreadsheet and header layout.
         """
+        if self._headers_verified():
+            logger.debug("Company sheet headers already verified, skipping check")
+            return
+        
         try:
             logger.info("Checking company sheet headers")
             existing_data = self.sheets_client.read_sheet(self.spreadsheet_id, COMPANY_SHEET_RANGE)
             
-            headers = [
-                "Company Name", "Address", "CVR", "Zip Code", "Town", "Phone", 
-                "Email", "Bank Name", "Bank Account", "IBAN", "SWIFT", "Additional Information"
-            ]
-            
             # If no data or headers don't match, set them up
-            if not existing_data or len(existing_data[0]) != len(headers):
+            if not existing_data or len(existing_data[0]) != len(COMPANY_HEADERS):
                 logger.info("Setting up company sheet headers")
                 self.sheets_client.write_sheet(
                     self.spreadsheet_id,
-                    "Company Details!A1:L1",
-                    [headers]
+                    COMPANY_HEADER_RANGE,
+                    [COMPANY_HEADERS]
                 )
                 logger.info("Company headers added successfully")
+            
+            self._mark_headers_verified()
                 
         except Exception as e:
             logger.error(f"Failed to setup company headers: {e}")
 
 
+# Shared input history, so Up recalls answers given to earlier fields
+_form_history = InMemoryHistory() if form_prompt is not None else None
+
+
 def get_user_input(prompt: str, current_value: str = "", required: bool = True) -> str:
     """
     Get user input with validation and current value display
     
+    On a terminal with prompt_toolkit installed the current value is
+    pre-filled for inline editing; otherwise it is shown in brackets and kept
+    when Enter is pressed.
+    
     Args:
         prompt: The prompt to display to the user
         current_value: Current value to display in brackets
@@ -228,6 +621,13 @@ def get_user_input(prompt: str, current_value: str = "", required: bool = True)
     Returns:
         User input string
     """
+    if form_prompt is not None and sys.stdin.isatty():
+        while True:
+            value = form_prompt(f"{prompt}: ", default=current_value, history=_form_history).strip()
+            if value or not required:
+                return value
+            print("This field is required. Please enter a value.")
+    
     while True:
         display_prompt = prompt
         if current_value:
@@ -257,17 +657,14 @@ def collect_company_details(existing_details: Optional[Dict[str, str]] = None) -
         Dictionary containing company data
     """
     if existing_details:
-        print("\n" + "="*60)
-        print("UPDATING EXISTING COMPANY DETAILS")
-        print("="*60)
-        print("Press Enter to keep current values, or type new values:")
+        title = "UPDATING EXISTING COMPANY DETAILS"
+        hint = "Press Enter to keep current values, or type new values:"
     else:
-        print("\n" + "="*60)
-        print("ST_FAKTURA - COMPANY DETAILS SETUP")
-        print("="*60)
-        print("Please enter your company information:")
+        title = "ST_FAKTURA - COMPANY DETAILS SETUP"
+        hint = "Please enter your company information:"
     
-    print()
+    sys.stdout.write(f"\n{SEP}\n{title}\n{SEP}\n{hint}\n\n")
+    sys.stdout.flush()
     
     current = existing_details or {}
     company_details = {}
@@ -316,7 +713,7 @@ def collect_company_details(existing_details: Optional[Dict[str, str]] = None) -
         "Additional Information", current.get('additional_info', ''), required=False
     )
     
-    return company_details
+    return normalize_company_details(company_details)
 
 
 def display_company_summary(company_details: Dict[str, str]) -> None:
@@ -326,39 +723,26 @@ def display_company_summary(company_details: Dict[str, str]) -> None:
     Args:
         company_details: Dictionary containing company information
     """
-    print("\n" + "="*60)
-    print("COMPANY INFORMATION SUMMARY")
-    print("="*60)
-    
-    print(f"Company Name:     {company_details['company_name']}")
-    print(f"Company Address:  {company_details['company_address']}")
-    print(f"Company CVR:      {company_details['company_cvr']}")
-    print(f"Company Zip:      {company_details['company_zip']}")
-    print(f"Company Town:     {company_details['company_town']}")
-    print(f"Company Phone:    {company_details['company_phone']}")
-    print(f"Company Email:    {company_details['company_email']}")
-    
-    print("\n--- Banking Information ---")
-    print(f"Bank Name:        {company_details['bank_name']}")
-    print(f"Bank Account:     {company_details['bank_account']}")
-    print(f"IBAN:             {company_details['iban']}")
-    print(f"SWIFT:            {company_details['swift']}")
-    
-    print("\n--- Additional Information ---")
-    print(f"Additional Info:  {company_details.get('additional_info', 'N/A')}")
-    print("="*60)
+    # Rendered and written in one go rather than one print() per line
+    sys.stdout.write(_SUMMARY_TEMPLATE % {'additional_info': 'N/A', **company_details})
+    sys.stdout.flush()
 
 
 def main() -> None:
     """
     Main function for company details management
     """
+    _configure_logging()
     logger.info("Starting ST_Faktura Company Details Management")
     
     try:
         # Initialize company details manager
         company_manager = CompanyDetailsManager()
         
+        # Retry Google Sheets saves left over from earlier runs while the user
+        # fills in the form; the worker runs them before any new save
+        company_manager.replay_pending_saves_async()
+        
         # Load existing details if available
         existing_details = company_manager.load_company_details()
         
@@ -374,9 +758,9 @@ def main() -> None:
         # Collect company details
         company_details = collect_company_details(existing_details)
         
-        # Validate details
-        errors = company_manager.validate_company_details(company_details)
-        if errors:
+        # Validate details; the full error list is only built when something is wrong
+        if not company_manager.is_company_details_valid(company_details):
+            errors = company_manager.validate_company_details(company_details)
             print("\n❌ Validation errors found:")
             for error in errors:
                 print(f"  - {error}")
@@ -388,20 +772,16 @@ def main() -> None:
         confirm = input("\nDo you want to save these company details? (y/N): ").strip().lower()
         
         if confirm == 'y':
-            # Save company details to both local file and Google Sheets
+            # Save company details to the local file, then sync Google Sheets in
+            # the background (the worker finishes before the process exits)
             local_saved = company_manager.save_company_details(company_details)
-            sheets_saved = company_manager.save_to_google_sheets(company_details)
             
-            if local_saved and sheets_saved:
+            if local_saved:
+                company_manager.save_to_google_sheets_async(company_details)
                 print(f"\n✅ Company details saved successfully!")
                 print(f"File location: {COMPANY_DETAILS_FILE}")
-                print(f"Google Sheets: Updated successfully")
+                print(f"Google Sheets: Saving in the background (failed saves are retried on the next run)")
                 logger.info("Company details management completed successfully")
-            elif local_saved:
-                print(f"\n⚠️ Company details saved to local file but failed to save to Google Sheets.")
-                print(f"File location: {COMPANY_DETAILS_FILE}")
-                print(f"Please check the logs for Google Sheets error details.")
-                logger.warning("Company details saved locally but not to Google Sheets")
             else:
                 print(f"\n❌ Failed to save company details. Please check the logs for details.")
                 sys.exit(1)
@@ -30,7 +30,7 @@ from CreateCustomer import CustomerManager
 from CreateTask import TaskManager
 from CreateInvoice import BOOKKEEPING_EMAIL, InvoiceManager, SPREADSHEET_ID, TASKS_SHEET_RANGE, upload_to_drive
 from invoice_utils import InvoiceNumberManager, InvoicePDFGenerator
-from Tool_MyCompanyDetails import CompanyDetailsManager
+from Tool_MyCompanyDetails import CompanyDetailsManager, normalize_company_details
 from storage_utils import (
     download_blob_to_path,
     get_env_bucket,
@@ -1249,7 +1249,7 @@ def get_local_invoice(file_path: str) -> FileResponse:
 @app.put("/company-details")
 def update_company_details(payload: UpdateCompanyDetailsRequest) -> Dict[str, Any]:
     manager = CompanyDetailsManager()
-    ok = manager.save_to_google_sheets(_payload_dict(payload))
+    ok = manager.save_to_google_sheets(normalize_company_details(_payload_dict(payload)))
     if not ok:
         raise HTTPException(status_code=400, detail="Failed to update company details")
     return {"status": "updated"}
@@ -0,0 +1,82 @@
+"""
+ST_Faktura Customer Cache
+
+Local copy of the Kunder sheet used by the task CLI to skip re-reading it.
+Kept apart from CreateTask so CreateCustomer can drop the cache after adding a
+customer without importing the task tool.
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from file_utils import atomic_write_bytes
+
+logger = logging.getLogger(__name__)
+
+# Cache file holding customer rows per spreadsheet ID; it contains customer
+# contact details, so it is only readable by the owner
+CUSTOMER_CACHE_FILE = Path(os.getenv('ST_FAKTURA_CACHE_DIR', Path.home() / '.cache' / 'st_faktura')) / 'customers.json'
+CUSTOMER_CACHE_TTL = float(os.getenv('CUSTOMER_CACHE_TTL', '300'))
+
+
+def load_cached_customers(spreadsheet_id: str, ttl: float) -> Optional[List[Dict[str, str]]]:
+    """
+    Load customers from the local cache if it is fresh for a spreadsheet
+    
+    Args:
+        spreadsheet_id: Spreadsheet the customers were read from
+        ttl: Seconds a cache entry stays valid
+        
+    Returns:
+        Cached customer dictionaries or None on a miss
+    """
+    try:
+        with open(CUSTOMER_CACHE_FILE, 'r', encoding='utf-8') as f:
+            entry = json.load(f).get(spreadsheet_id)
+    except (OSError, ValueError):
+        return None
+    
+    if not entry or time.time() - entry.get('mtime', 0) > ttl:
+        return None
+    return entry.get('customers')
+
+
+def save_cached_customers(spreadsheet_id: str, customers: List[Dict[str, str]]) -> None:
+    """
+    Store customers in the local cache, keyed by spreadsheet ID
+    
+    Args:
+        spreadsheet_id: Spreadsheet the customers were read from
+        customers: Customer dictionaries to cache
+    """
+    try:
+        try:
+            with open(CUSTOMER_CACHE_FILE, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        
+        cache[spreadsheet_id] = {'mtime': time.time(), 'customers': customers}
+        CUSTOMER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(
+            str(CUSTOMER_CACHE_FILE),
+            json.dumps(cache, ensure_ascii=False).encode('utf-8'),
+            mode=0o600
+        )
+        
+    except OSError as e:
+        logger.warning("Failed to write customer cache: %s", e)
+
+
+def invalidate_customer_cache() -> None:
+    """Drop the local customer cache, e.g. after a customer was added"""
+    try:
+        CUSTOMER_CACHE_FILE.unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning("Failed to remove customer cache: %s", e)
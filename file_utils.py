@@ -0,0 +1,65 @@
+"""
+ST_Faktura File Utilities
+
+Small file-writing helpers shared by the invoice numbering, PDF generation and
+company details modules. Kept free of third-party imports so any tool can use them.
+"""
+
+import os
+import stat
+import tempfile
+from typing import Optional
+
+
+def write_bytes(path: str, data, fsync: bool = False) -> None:
+    """Write data to path with as few write() calls as the OS allows (normally one), optionally fsync'ed"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        if fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def atomic_write_bytes(path: str, payload: bytes, mode: Optional[int] = None) -> None:
+    """
+    Write a file by swapping in a fully written temporary file
+    
+    A crash mid-write therefore never leaves a truncated file behind; the data is
+    fsync'ed before the swap so the rename can't land ahead of it. The
+    temporary file comes from mkstemp, so concurrent writers (threads or
+    processes) never share one. Unless mode is given, an existing file keeps its
+    permissions and a new file is created 0600.
+    
+    Args:
+        path: File to write
+        payload: Complete file contents
+        mode: Permission bits for the written file
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        if mode is not None:
+            os.fchmod(fd, mode)
+        else:
+            try:
+                os.fchmod(fd, stat.S_IMODE(os.stat(path).st_mode))
+            except FileNotFoundError:
+                pass
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+        os.close(fd)
+        fd = None
+        os.replace(tmp_path, path)
+    except BaseException:
+        if fd is not None:
+            os.close(fd)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
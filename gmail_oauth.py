@@ -16,12 +16,14 @@ from __future__ import annotations
 import os
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
 from pathlib import Path
 
-from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
 
 logger = logging.getLogger(__name__)
 
@@ -31,8 +33,19 @@ SCOPES = ["https://mail.google.com/"]
 DEFAULT_CLIENT_SECRET = "gmail_credentials.json"
 DEFAULT_TOKEN_FILE = "gmail_token.json"
 
+# Valid credentials per user email, reused until they expire
+_cred_cache: dict[str, Credentials] = {}
 
+# Cached tokens this close to expiry are refreshed in the background
+REFRESH_AHEAD = timedelta(minutes=5)
+_refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='gmail-token-refresh')
+_refreshing: set[str] = set()
+_refreshing_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
 def _paths() -> tuple[Path, Path]:
+    # Resolved once per process; changes to the env vars afterwards are ignored
     client_path = Path(os.getenv("GMAIL_CLIENT_SECRET_FILE", DEFAULT_CLIENT_SECRET)).expanduser()
     token_path = Path(os.getenv("GMAIL_TOKEN_FILE", DEFAULT_TOKEN_FILE)).expanduser()
     return client_path, token_path
@@ -42,7 +55,14 @@ def get_gmail_access_token(user_email: str) -> Optional[str]:
     """Return a valid Gmail OAuth access token or None on failure.
 
     Handles refresh automatically. If no token exists, runs local OAuth flow.
+    Credentials are cached in memory per user, so repeated calls in one
+    process only touch the token file again once the token has expired.
     """
+    cached = _cred_cache.get(user_email)
+    if cached is not None and cached.valid and cached.token:
+        _schedule_refresh_if_expiring(user_email, cached)
+        return cached.token
+
     client_path, token_path = _paths()
 
     if not client_path.exists():
@@ -54,7 +74,7 @@ def get_gmail_access_token(user_email: str) -> Optional[str]:
     # Load existing token
     if token_path.exists():
         try:
-            creds = Credentials.from_authorized_user_file(str(token_path), SCOPES)
+            creds = Credentials.from_authorized_user_info(json.loads(token_path.read_bytes()), SCOPES)
         except Exception as e:
             logger.warning(f"Failed to load existing token file: {e}")
             creds = None
@@ -62,6 +82,8 @@ def get_gmail_access_token(user_email: str) -> Optional[str]:
     # Refresh if expired and refresh token available
     if creds and creds.expired and creds.refresh_token:
         try:
+            from google.auth.transport.requests import Request
+
             creds.refresh(Request())
             _save_creds(creds, token_path)
         except Exception as e:
@@ -71,6 +93,9 @@ def get_gmail_access_token(user_email: str) -> Optional[str]:
     # If no valid creds, run flow
     if not creds or not creds.valid:
         try:
+            # Only needed for the interactive first-time flow
+            from google_auth_oauthlib.flow import InstalledAppFlow
+
             flow = InstalledAppFlow.from_client_secrets_file(str(client_path), SCOPES)
             creds = flow.run_local_server(port=0, prompt='consent')
             _save_creds(creds, token_path)
@@ -83,10 +108,45 @@ def get_gmail_access_token(user_email: str) -> Optional[str]:
         return None
 
     if user_email and creds.token:
+        _cred_cache[user_email] = creds
         return creds.token
     return None
 
 
+def _schedule_refresh_if_expiring(user_email: str, creds: Credentials) -> None:
+    """Start a background refresh if the cached token expires within REFRESH_AHEAD.
+
+    The caller keeps using the current, still valid token meanwhile.
+    """
+    if not creds.expiry or not creds.refresh_token:
+        return
+    # google-auth stores expiry as naive UTC
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    if creds.expiry - now > REFRESH_AHEAD:
+        return
+    with _refreshing_lock:
+        if user_email in _refreshing:
+            return
+        _refreshing.add(user_email)
+    _refresh_executor.submit(_refresh_in_background, user_email, creds)
+
+
+def _refresh_in_background(user_email: str, creds: Credentials) -> None:
+    try:
+        from google.auth.transport.requests import Request
+
+        creds.refresh(Request())
+        _save_creds(creds, _paths()[1])
+        logger.info("Refreshed Gmail token ahead of expiry")
+    except Exception as e:
+        # Drop the cache entry so the next call takes the synchronous path
+        logger.warning(f"Background Gmail token refresh failed: {e}")
+        _cred_cache.pop(user_email, None)
+    finally:
+        with _refreshing_lock:
+            _refreshing.discard(user_email)
+
+
 def _save_creds(creds: Credentials, token_path: Path) -> None:
     try:
         with open(token_path, 'w', encoding='utf-8') as f:
@@ -6,34 +6,116 @@ using the Google Sheets API v4.
 """
 
 import os
-import pickle
+import hashlib
+import json
+import random
+import re
+import tempfile
+import threading
+import time
+import atexit
 import logging
+import logging.handlers
+import multiprocessing
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Sequence, Tuple, Union
+from urllib.parse import quote
 from dotenv import load_dotenv
 
-from google.auth.transport.requests import Request
+import httplib2
+from google.auth.transport.requests import AuthorizedSession, Request
+from google_auth_httplib2 import AuthorizedHttp
 from google.oauth2.credentials import Credentials
 from google.oauth2.service_account import Credentials as ServiceAccountCredentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
+import requests
+from requests.adapters import HTTPAdapter
 
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json decoder
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; stream_sheet falls back to read_sheet
+    ijson = None
+
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('st_faktura_sheets.log'),
-        logging.StreamHandler()
-    ]
-)
+# Handlers are installed lazily by _configure_logging when the first client is
+# created, so importing this module (e.g. in worker processes) opens no files
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+_logging_configured = False
+_logging_lock = threading.Lock()
+
+
+def _configure_logging(log_file: str, log_level: str = 'INFO') -> None:
+    """
+    Configure console and file logging once per process, unless the application already has its own handlers
+    
+    Records go through a QueueHandler; a QueueListener thread does the actual
+    file and console writes, so API calls never block on log I/O. The queue is
+    a multiprocessing queue, so worker processes (see
+    invoice_utils.generate_invoices_bulk) can log to the same file.
+    
+    Args:
+        log_file: Path of the log file (SheetsConfig.log_file)
+        log_level: Name of the root log level (SheetsConfig.log_level)
+    """
+    global _logging_configured
+    with _logging_lock:
+        if _logging_configured:
+            return
+        _logging_configured = True
+        root = logging.getLogger()
+        if root.handlers:
+            return
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handlers = [logging.FileHandler(log_file), logging.StreamHandler()]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        log_queue = multiprocessing.Queue()
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+        root.setLevel(getattr(logging, log_level.upper(), logging.INFO))
+
+# HTTP statuses from the Sheets API that are worth retrying with backoff
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+MAX_BACKOFF_SECONDS = 32
+
+SHEETS_API_BASE_URL = "https://sheets.googleapis.com/v4/spreadsheets"
+
+# Cells per request when splitting large writes (see write_sheet_chunked)
+WRITE_CHUNK_CELLS = 10000
+
+# Top-left cell of an A1 range such as "B5", "B5:E9" or "A:Z" (row defaults to 1)
+_A1_START_RE = re.compile(r'^\$?([A-Za-z]+)\$?(\d*)')
+
+# Cell part of an A1 range: "B2:D10", "A:C", "A2:C", "B5" (each bound optional)
+_A1_RANGE_RE = re.compile(r'^\$?([A-Za-z]*)\$?(\d*)(?::\$?([A-Za-z]*)\$?(\d*))?$')
+
+# Spreadsheet ID inside a Google Sheets URL
+_SID_RE = re.compile(r"/spreadsheets/d/([a-zA-Z0-9_-]{20,})")
+
+# Cached access tokens are only reused while they have at least this long left
+TOKEN_CACHE_MIN_VALIDITY = timedelta(minutes=5)
+
+# Window of the client-side request quota, matching the Sheets per-minute quotas
+RATE_LIMIT_WINDOW_SECONDS = 60
 
 
 class SheetsConfig:
@@ -43,9 +125,18 @@ class SheetsConfig:
         """Initialize configuration from environment variables"""
         self.service_account_file = os.getenv('SERVICE_ACCOUNT_FILE') or self._default_service_account_path()
         self.oauth_credentials_file = os.getenv('OAUTH_CREDENTIALS_FILE', 'credentials.json')
-        self.oauth_token_file = os.getenv('OAUTH_TOKEN_FILE', 'token.pickle')
+        self.oauth_token_file = os.getenv('OAUTH_TOKEN_FILE', 'token.json')
         self.log_level = os.getenv('LOG_LEVEL', 'INFO')
         self.log_file = os.getenv('SHEETS_LOG_FILE', 'st_faktura_sheets.log')
+        self.max_retries = int(os.getenv('SHEETS_MAX_RETRIES', '5'))
+        self.http_timeout = float(os.getenv('SHEETS_HTTP_TIMEOUT', '60'))
+        self.http_pool_size = int(os.getenv('SHEETS_HTTP_POOL_SIZE', '10'))
+        self.token_cache_file = os.getenv('SHEETS_TOKEN_CACHE_FILE') or os.path.join(
+            os.getenv('ST_FAKTURA_CACHE_DIR') or os.path.join(os.path.expanduser('~'), '.cache', 'st_faktura'),
+            'token.json'
+        )
+        self.reads_per_minute = int(os.getenv('SHEETS_READS_PER_MINUTE', '60'))
+        self.writes_per_minute = int(os.getenv('SHEETS_WRITES_PER_MINUTE', '60'))
 
     @staticmethod
     def _default_service_account_path() -> str:
@@ -54,6 +145,145 @@ class SheetsConfig:
         return 'service_account.json'
 
 
+class _TokenCache:
+    """
+    On-disk cache of access tokens shared between processes
+    
+    Entries are keyed by a SHA-256 of the credential identity and scopes and
+    the file is only readable by the owner, since it holds bearer tokens.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Initialize the token cache
+        
+        Args:
+            path: JSON file holding the cached tokens
+        """
+        self.path = path
+    
+    @staticmethod
+    def key(identity: str, scopes: Sequence[str]) -> str:
+        """Build the cache key for a credential identity and its scopes"""
+        return hashlib.sha256("\n".join([identity, *sorted(scopes)]).encode('utf-8')).hexdigest()
+    
+    def _load(self) -> Dict[str, Dict[str, str]]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def get(self, key: str) -> Optional[Tuple[str, datetime]]:
+        """
+        Look up a cached token that is still valid for a while
+        
+        Args:
+            key: Cache key from key()
+            
+        Returns:
+            Tuple of (token, naive UTC expiry) or None on a miss
+        """
+        entry = self._load().get(key)
+        if not entry:
+            return None
+        try:
+            expiry = datetime.fromisoformat(entry['expiry'])
+        except (KeyError, TypeError, ValueError):
+            return None
+        # google-auth works with naive UTC datetimes
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        if expiry - now < TOKEN_CACHE_MIN_VALIDITY:
+            return None
+        return entry.get('token'), expiry
+    
+    def put(self, key: str, token: str, expiry: datetime) -> None:
+        """
+        Store a token, writing the cache file atomically with 0600 permissions
+        
+        Args:
+            key: Cache key from key()
+            token: Access token
+            expiry: Naive UTC expiry of the token
+        """
+        entries = self._load()
+        entries[key] = {'token': token, 'expiry': expiry.isoformat()}
+        try:
+            directory = os.path.dirname(self.path) or '.'
+            os.makedirs(directory, exist_ok=True)
+            # mkstemp gives each process its own 0600 temp file, so concurrent
+            # refreshes can't truncate each other's file before the swap
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(self.path) + '.', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(entries, f)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
+        except OSError as e:
+            logger.warning("Failed to write token cache: %s", e)
+
+
+class RateLimiter:
+    """Sliding-window limiter allowing at most `limit` calls per `window` seconds"""
+    
+    def __init__(self, limit: int, window: float = RATE_LIMIT_WINDOW_SECONDS):
+        """
+        Initialize the rate limiter
+        
+        Args:
+            limit: Maximum number of calls per window (0 disables limiting)
+            window: Window length in seconds
+        """
+        self.limit = limit
+        self.window = window
+        self._calls = deque()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until another call fits in the window, then record it"""
+        if self.limit <= 0:
+            return
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.window:
+                    self._calls.popleft()
+                if len(self._calls) < self.limit:
+                    break
+                delay = self.window - (now - self._calls[0])
+                logger.info("Sheets client quota reached, waiting %.1fs", delay)
+                time.sleep(delay)
+            self._calls.append(time.monotonic())
+
+
+class OrjsonModel(JsonModel):
+    """JsonModel that encodes request bodies and decodes API responses with orjson"""
+
+    def serialize(self, body_value):
+        if isinstance(body_value, dict) and 'data' not in body_value and self._data_wrapper:
+            body_value = {'data': body_value}
+        try:
+            # bytes are sent as-is by the transport
+            return orjson.dumps(body_value, option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            # Types orjson rejects (e.g. Decimal) keep the stdlib behaviour
+            return super().serialize(body_value)
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+            body = body['data']
+        return body
+
+
 class GoogleSheetsClient:
     """
     A client for interacting with Google Sheets API
@@ -74,13 +304,23 @@ class GoogleSheetsClient:
             config_dir: Directory containing credential files (defaults to current directory)
             config: Configuration object (defaults to SheetsConfig())
         """
+        self.config = config or SheetsConfig()
+        _configure_logging(self.config.log_file, self.config.log_level)
         self.auth_method = auth_method
         self.config_dir = config_dir or os.getcwd()
-        self.config = config or SheetsConfig()
         self.service = None
         self.creds = None
+        # Keep-alive transport shared by all API calls, set by _build_service
+        self.http: Optional[AuthorizedHttp] = None
+        # Pooled session for streamed reads, created on first use
+        self._session: Optional[AuthorizedSession] = None
+        # Sheets enforces read and write quotas separately
+        self._read_limiter = RateLimiter(self.config.reads_per_minute)
+        self._write_limiter = RateLimiter(self.config.writes_per_minute)
+        # Numeric sheet IDs by (spreadsheet ID, sheet title), for GridRange requests
+        self._sheet_ids: Dict[Tuple[str, str], int] = {}
         
-        logger.info(f"Initializing Google Sheets client with {auth_method} authentication")
+        logger.info("Initializing Google Sheets client with %s authentication", auth_method)
         
         # Authenticate and build service
         self._authenticate()
@@ -115,11 +355,35 @@ class GoogleSheetsClient:
             self.creds = ServiceAccountCredentials.from_service_account_file(
                 service_account_file, scopes=self.SCOPES
             )
+            self._reuse_cached_token(f"{self.creds.service_account_email}:{self.creds.signer.key_id}")
             logger.info("Successfully authenticated using service account")
         except Exception as e:
-            logger.error(f"Failed to authenticate with service account: {e}")
+            logger.error("Failed to authenticate with service account: %s", e)
             raise
     
+    def _reuse_cached_token(self, identity: str) -> None:
+        """
+        Reuse an access token minted by an earlier process, or mint and cache one
+        
+        Args:
+            identity: Stable identifier of the credentials (e.g. account email and key id)
+        """
+        cache = _TokenCache(self.config.token_cache_file)
+        key = _TokenCache.key(identity, self.SCOPES)
+        cached = cache.get(key)
+        if cached is not None:
+            self.creds.token, self.creds.expiry = cached
+            logger.debug("Reusing cached access token")
+            return
+        
+        try:
+            self.creds.refresh(Request())
+        except Exception as e:
+            # Leave it to the first API call to fetch a token
+            logger.warning("Failed to fetch access token up front: %s", e)
+            return
+        cache.put(key, self.creds.token, self.creds.expiry)
+    
     def _authenticate_oauth(self) -> None:
         """Authenticate using OAuth 2.0"""
         creds = None
@@ -135,11 +399,11 @@ class GoogleSheetsClient:
         # Load existing token if available
         if os.path.exists(token_file):
             try:
-                with open(token_file, 'rb') as token:
-                    creds = pickle.load(token)
+                with open(token_file, 'r', encoding='utf-8') as token:
+                    creds = Credentials.from_authorized_user_info(json.load(token), self.SCOPES)
                 logger.debug("Loaded existing OAuth token")
             except Exception as e:
-                logger.warning(f"Failed to load existing token: {e}")
+                logger.warning("Failed to load existing token: %s", e)
         
         # If no valid credentials, get new ones
         if not creds or not creds.valid:
@@ -148,7 +412,7 @@ class GoogleSheetsClient:
                     creds.refresh(Request())
                     logger.info("Refreshed OAuth token")
                 except Exception as e:
-                    logger.error(f"Failed to refresh token: {e}")
+                    logger.error("Failed to refresh token: %s", e)
                     creds = None
             
             if not creds:
@@ -167,16 +431,16 @@ class GoogleSheetsClient:
                     creds = flow.run_local_server(port=0)
                     logger.info("Obtained new OAuth credentials")
                 except Exception as e:
-                    logger.error(f"Failed to obtain OAuth credentials: {e}")
+                    logger.error("Failed to obtain OAuth credentials: %s", e)
                     raise
             
             # Save credentials for next run
             try:
-                with open(token_file, 'wb') as token:
-                    pickle.dump(creds, token)
+                with open(token_file, 'w', encoding='utf-8') as token:
+                    token.write(creds.to_json())
                 logger.debug("Saved OAuth token for future use")
             except Exception as e:
-                logger.warning(f"Failed to save token: {e}")
+                logger.warning("Failed to save token: %s", e)
         
         self.creds = creds
         logger.info("Successfully authenticated using OAuth 2.0")
@@ -184,13 +448,131 @@ class GoogleSheetsClient:
     def _build_service(self) -> None:
         """Build the Google Sheets API service"""
         try:
-            self.service = build('sheets', 'v4', credentials=self.creds)
+            model = OrjsonModel() if orjson else None
+            # One authorized Http for the lifetime of the client, so the TLS
+            # connection to the API is kept alive and reused between calls
+            self.http = AuthorizedHttp(self.creds, http=httplib2.Http(timeout=self.config.http_timeout))
+            # Use the discovery document bundled with google-api-python-client
+            # (>= 2.0) instead of fetching it over HTTPS on every start;
+            # cache_discovery=False skips the legacy file cache lookup
+            try:
+                self.service = build('sheets', 'v4', http=self.http, model=model,
+                                     cache_discovery=False, static_discovery=True)
+            except TypeError:
+                # Older client without static_discovery; discovery is fetched online
+                self.service = build('sheets', 'v4', http=self.http, model=model, cache_discovery=False)
             logger.info("Google Sheets API service ready")
         except Exception as e:
             error_msg = f"Failed to build Google Sheets service: {e}"
             logger.error(error_msg)
             raise Exception(error_msg)
     
+    def _get_session(self) -> AuthorizedSession:
+        """
+        Return the shared requests session, creating it on first use
+        
+        Returns:
+            AuthorizedSession with a connection pool sized from the config
+        """
+        if self._session is None:
+            session = AuthorizedSession(self.creds)
+            adapter = HTTPAdapter(
+                pool_connections=self.config.http_pool_size,
+                pool_maxsize=self.config.http_pool_size
+            )
+            session.mount('https://', adapter)
+            self._session = session
+        return self._session
+    
+    def _execute(self, request) -> Dict[str, Any]:
+        """
+        Execute an API request, retrying transient errors with exponential backoff
+        
+        Requests are paced by the client-side read/write rate limiters first,
+        so normal workloads stay under quota instead of relying on 429 retries.
+        Writes such as values().append are not idempotent, so they are only
+        retried when the server cannot have applied them: on 429, or when the
+        connection was refused before the request was sent.
+        
+        Args:
+            request: The API request to execute
+            
+        Returns:
+            Dictionary containing the API response
+            
+        Raises:
+            HttpError: If the error is not transient or all retries are exhausted
+        """
+        idempotent = request.method == 'GET'
+        limiter = self._read_limiter if idempotent else self._write_limiter
+        attempt = 0
+        while True:
+            limiter.acquire()
+            try:
+                return request.execute()
+            except HttpError as error:
+                status = getattr(error.resp, 'status', None)
+                retryable = status in RETRYABLE_STATUS_CODES if idempotent else status == 429
+                if not retryable or attempt >= self.config.max_retries:
+                    raise
+                attempt += 1
+                self._backoff(attempt, f"Sheets API returned {status}")
+            except (ConnectionError, TimeoutError) as error:
+                # Dropped keep-alive connections and timeouts are transient too,
+                # but a write may already have been committed unless it was refused
+                if (not idempotent and not isinstance(error, ConnectionRefusedError)) \
+                        or attempt >= self.config.max_retries:
+                    raise
+                attempt += 1
+                self._backoff(attempt, f"Sheets API connection failed ({error})")
+    
+    def _backoff(self, attempt: int, reason: str) -> None:
+        """
+        Sleep before retry number `attempt`, with exponential backoff and jitter
+        
+        Args:
+            attempt: 1-based retry number
+            reason: What went wrong, for the log message
+        """
+        delay = min(MAX_BACKOFF_SECONDS, 2 ** attempt) + random.random()
+        logger.warning(
+            "%s, retrying in %.1fs (attempt %d/%d)",
+            reason, delay, attempt, self.config.max_retries
+        )
+        time.sleep(delay)
+    
+    def _open_stream(self, url: str):
+        """
+        Open a streamed GET request, retrying transient errors like _execute
+        
+        Args:
+            url: Sheets API URL to fetch
+            
+        Returns:
+            The open requests.Response (use it as a context manager)
+            
+        Raises:
+            requests.HTTPError: If the error is not transient or all retries are exhausted
+            requests.ConnectionError, requests.Timeout: If all retries are exhausted
+        """
+        attempt = 0
+        while True:
+            self._read_limiter.acquire()
+            try:
+                response = self._get_session().get(url, stream=True, timeout=self.config.http_timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as error:
+                if attempt >= self.config.max_retries:
+                    raise
+                attempt += 1
+                self._backoff(attempt, f"Sheets API connection failed ({error})")
+                continue
+            if response.status_code not in RETRYABLE_STATUS_CODES or attempt >= self.config.max_retries:
+                response.raise_for_status()
+                return response
+            response.close()
+            attempt += 1
+            self._backoff(attempt, f"Sheets API returned {response.status_code}")
+    
     def read_sheet(self, spreadsheet_id: str, range_name: str = "A:Z") -> List[List[str]]:
         """
         Read data from a Google Sheet
@@ -206,14 +588,14 @@ class GoogleSheetsClient:
             HttpError: If there's an error accessing the Google Sheet
         """
         try:
-            logger.debug(f"Reading sheet {spreadsheet_id}, range: {range_name}")
-            result = self.service.spreadsheets().values().get(
+            logger.debug("Reading sheet %s, range: %s", spreadsheet_id, range_name)
+            result = self._execute(self.service.spreadsheets().values().get(
                 spreadsheetId=spreadsheet_id,
                 range=range_name
-            ).execute()
+            ))
             
             values = result.get('values', [])
-            logger.info(f"Successfully read {len(values)} rows from sheet")
+            logger.info("Successfully read %d rows from sheet", len(values))
             return values
             
         except HttpError as error:
@@ -221,6 +603,151 @@ class GoogleSheetsClient:
             logger.error(error_msg)
             raise
     
+    def batch_get(self, spreadsheet_id: str, ranges: List[str]) -> List[List[List[str]]]:
+        """
+        Read several ranges from a Google Sheet in a single request
+        
+        Args:
+            spreadsheet_id: The ID of the Google Sheet
+            ranges: The ranges to read (e.g., ["Sheet1!A1:F1", "Sheet2!A:A"])
+        
+        Returns:
+            One list of rows per requested range, in the same order as ranges
+        
+        Raises:
+            HttpError: If there's an error accessing the Google Sheet
+        """
+        try:
+            logger.debug("Batch reading sheet %s, ranges: %s", spreadsheet_id, ranges)
+            result = self._execute(self.service.spreadsheets().values().batchGet(
+                spreadsheetId=spreadsheet_id,
+                ranges=ranges
+            ))
+            
+            values = [value_range.get('values', []) for value_range in result.get('valueRanges', [])]
+            logger.info("Successfully read %d ranges from sheet", len(values))
+            return values
+            
+        except HttpError as error:
+            error_msg = f"Error batch reading sheet: {error}"
+            logger.error(error_msg)
+            raise
+    
+    def read_sheets_batch(self, spreadsheet_id: str, ranges: List[str]) -> Dict[str, List[List[str]]]:
+        """
+        Read several ranges from a Google Sheet in a single request, keyed by range
+        
+        Args:
+            spreadsheet_id: The ID of the Google Sheet
+            ranges: The ranges to read (e.g., ["Kunder!A:I", "Opgave!A:I"])
+        
+        Returns:
+            Dictionary mapping each requested range, as given, to its list of rows
+        
+        Raises:
+            HttpError: If there's an error accessing the Google Sheet
+        """
+        # Keyed by the requested ranges rather than the normalized ranges the
+        # API echoes back (e.g. "'Kunder'!A1:I500"), so callers can look them up
+        return dict(zip(ranges, self.batch_get(spreadsheet_id, ranges)))
+    
+    def stream_sheet(self, spreadsheet_id: str, range_name: str = "A:Z",
+                     columns: Optional[Sequence[int]] = None) -> Iterator[List[str]]:
+        """
+        Stream rows from a Google Sheet without materializing the whole response
+        
+        The response body is parsed incrementally with ijson, so only one row is
+        held in memory at a time. Falls back to read_sheet if ijson is missing.
+        
+        Args:
+            spreadsheet_id: The ID of the Google Sheet
+            range_name: The range to read (e.g., "A1:E10", "Sheet1!A:Z")
+            columns: Optional column indexes to keep from each row (missing cells become '')
+        
+        Yields:
+            Each row as a list of cell values
+        
+        Raises:
+            requests.HTTPError: If there's an error accessing the Google Sheet
+        """
+        def project(row: List[str]) -> List[str]:
+            if columns is None:
+                return row
+            return [row[i] if i < len(row) else '' for i in columns]
+        
+        if ijson is None:
+            for row in self.read_sheet(spreadsheet_id, range_name):
+                yield project(row)
+            return
+        
+        logger.debug("Streaming sheet %s, range: %s", spreadsheet_id, range_name)
+        url = f"{SHEETS_API_BASE_URL}/{spreadsheet_id}/values/{quote(range_name, safe='')}"
+        with self._open_stream(url) as response:
+            response.raw.decode_content = True
+            for row in ijson.items(response.raw, 'values.item'):
+                yield project(row)
+    
+    def get_sheet_row_count(self, spreadsheet_id: str, sheet_name: str) -> int:
+        """
+        Get the number of grid rows of one sheet (tab), without any cell data
+        
+        Args:
+            spreadsheet_id: The ID of the Google Sheet
+            sheet_name: Title of the sheet
+            
+        Returns:
+            Row count of the sheet's grid
+            
+        Raises:
+            ValueError: If the spreadsheet has no sheet with that title
+            HttpError: If there's an error accessing the Google Sheet
+        """
+        result = self._execute(self.service.spreadsheets().get(
+            spreadsheetId=spreadsheet_id,
+            fields='sheets.properties(title,gridProperties.rowCount)'
+        ))
+        for sheet in result.get('sheets', []):
+            properties = sheet.get('properties', {})
+            if properties.get('title') == sheet_name:
+                return properties.get('gridProperties', {}).get('rowCount', 0)
+        raise ValueError(f"Sheet '{sheet_name}' not found in spreadsheet {spreadsheet_id}")
+    
+    def iter_sheet_chunks(self, spreadsheet_id: str, sheet_name: str, chunk_rows: int = 1000,
+                          last_column: str = "Z") -> Iterator[List[List[str]]]:
+        """
+        Read a large sheet as successive blocks of rows
+        
+        Each block is a separate values.get over the next chunk_rows rows, so the
+        first rows are available early and memory stays bounded by one block.
+        Empty rows between blocks are kept, so concatenating the blocks gives the
+        same rows as reading the whole range at once.
+        
+        Args:
+            spreadsheet_id: The ID of the Google Sheet
+            sheet_name: Title of the sheet to read
+            chunk_rows: Rows per request
+            last_column: Rightmost column to read
+            
+        Yields:
+            Lists of rows, in sheet order
+            
+        Raises:
+            ValueError: If the sheet doesn't exist
+            HttpError: If there's an error accessing the Google Sheet
+        """
+        total_rows = self.get_sheet_row_count(spreadsheet_id, sheet_name)
+        quoted_sheet = "'" + sheet_name.replace("'", "''") + "'"
+        # Sheets drops trailing empty rows from each response; carry them forward
+        # and only emit them once a later block turns out to have data
+        pending_blank = 0
+        for start in range(1, total_rows + 1, chunk_rows):
+            end = min(start + chunk_rows - 1, total_rows)
+            rows = self.read_sheet(spreadsheet_id, f"{quoted_sheet}!A{start}:{last_column}{end}")
+            if rows:
+                yield [[] for _ in range(pending_blank)] + rows if pending_blank else rows
+                pending_blank = 0
+            pending_blank += end - start + 1 - len(rows)
+    
     def read_sheet_as_dataframe(self, spreadsheet_id: str, range_name: str = "A:Z", 
                                header_row: int = 0) -> pd.DataFrame:
         """
@@ -264,20 +791,20 @@ class GoogleSheetsClient:
             HttpError: If there's an error writing to the Google Sheet
         """
         try:
-            logger.debug(f"Writing to sheet {spreadsheet_id}, range: {range_name}, rows: {len(values)}")
+            logger.debug("Writing to sheet %s, range: %s, rows: %d", spreadsheet_id, range_name, len(values))
             body = {
                 'values': values
             }
             
-            result = self.service.spreadsheets().values().update(
+            result = self._execute(self.service.spreadsheets().values().update(
                 spreadsheetId=spreadsheet_id,
                 range=range_name,
                 valueInputOption=value_input_option,
                 body=body
-            ).execute()
+            ))
             
             updated_cells = result.get('updatedCells', 0)
-            logger.info(f"Successfully updated {updated_cells} cells in sheet")
+            logger.info("Successfully updated %s cells in sheet", updated_cells)
             return result
             
         except HttpError as error:
@@ -285,8 +812,110 @@ class GoogleSheetsClient:
             logger.error(error_msg)
             raise
     
+    def batch_update(self, spreadsheet_id: str, data: List[Dict[str, Any]],
+                     value_input_option: str = "RAW") -> Dict[str, Any]:
+        """
+        Write several ranges of a Google Sheet in a single request
+        
+        Args:
+            spreadsheet_id: The ID of the Google Sheet
+            data: List of {"range": ..., "values": [[...], ...]} entries to write
+            value_input_option: How to interpret the data ("RAW" or "USER_ENTERED")
+            
+        Returns:
+            Dictionary containing the API response
+            
+        Raises:
+            HttpError: If there's an error writing to the Google Sheet
+        """
+        try:
+            logger.debug("Batch writing to sheet %s, ranges: %d", spreadsheet_id, len(data))
+            body = {
+                'valueInputOption': value_input_option,
+                'data': data
+            }
+            
+            result = self._execute(self.service.spreadsheets().values().batchUpdate(
+                spreadsheetId=spreadsheet_id,
+                body=body
+            ))
+            
+            updated_cells = result.get('totalUpdatedCells', 0)
+            logger.info("Successfully updated %s cells in sheet", updated_cells)
+            return result
+            
+        except HttpError as error:
+            error_msg = f"Error batch writing to sheet: {error}"
+            logger.error(error_msg)
+            raise
+    
+    def batch_write_sheets(self, spreadsheet_id: str, updates: List[Tuple[str, List[List[Any]]]],
+                           value_input_option: str = "RAW") -> Dict[str, Any]:
+        """
+        Write several (range, values) pairs of a Google Sheet in a single request
+        
+        Args:
+            spreadsheet_id: The ID of the Google Sheet
+            updates: List of (range, 2D values) pairs to write
+            value_input_option: How to interpret the data ("RAW" or "USER_ENTERED")
+            
+        Returns:
+            Dictionary containing the API response (empty if there were no updates)
+            
+        Raises:
+            HttpError: If there's an error writing to the Google Sheet
+        """
+        if not updates:
+            return {}
+        data = [{'range': range_name, 'values': values} for range_name, values in updates]
+        return self.batch_update(spreadsheet_id, data, value_input_option)
+    
+    def write_sheet_chunked(self, spreadsheet_id: str, range_name: str,
+                            values: List[List[Any]], value_input_option: str = "RAW",
+                            max_cells: int = WRITE_CHUNK_CELLS) -> int:
+        """
+        Write a large block of values as a series of smaller requests
+        
+        The rows are split into chunks of at most max_cells cells, each written
+        at its shifted start row, so no single request body grows unbounded.
+        
+        Args:
+            spreadsheet_id: The ID of the Google Sheet
+            range_name: Range whose top-left cell is the start (e.g. "Sheet1!A1", "Opgave!B5:E")
+            values: 2D list of values to write
+            value_input_option: How to interpret the data ("RAW" or "USER_ENTERED")
+            max_cells: Upper bound on cells per request
+            
+        Returns:
+            Total number of updated cells
+            
+        Raises:
+            ValueError: If the start cell can't be parsed from range_name
+            HttpError: If there's an error writing to the Google Sheet
+        """
+        sheet, separator, cells = range_name.rpartition('!')
+        match = _A1_START_RE.match(cells)
+        if not match:
+            raise ValueError(f"Can't determine start cell of range '{range_name}'")
+        column, row = match.group(1), int(match.group(2) or 1)
+        prefix = f"{sheet}{separator}"
+        
+        width = max((len(row_values) for row_values in values), default=1) or 1
+        chunk_rows = max(1, max_cells // width)
+        last_column = _column_name(_column_index(column) + width - 1)
+        
+        updated_cells = 0
+        for offset in range(0, len(values), chunk_rows):
+            chunk = values[offset:offset + chunk_rows]
+            chunk_range = f"{prefix}{column}{row + offset}:{last_column}{row + offset + len(chunk) - 1}"
+            result = self.write_sheet(spreadsheet_id, chunk_range, chunk, value_input_option)
+            updated_cells += result.get('updatedCells', 0)
+            logger.info("Wrote rows %d-%d of %d", offset + 1, offset + len(chunk), len(values))
+        return updated_cells
+    
     def write_dataframe_to_sheet(self, spreadsheet_id: str, range_name: str, 
-                                df: pd.DataFrame, include_header: bool = True) -> Dict[str, Any]:
+                                df: pd.DataFrame, include_header: bool = True,
+                                batch: Optional[List[Tuple[str, List[List[Any]]]]] = None) -> Dict[str, Any]:
         """
         Write a pandas DataFrame to a Google Sheet
         
@@ -295,20 +924,25 @@ class GoogleSheetsClient:
             range_name: The range to write to
             df: pandas DataFrame to write
             include_header: Whether to include column headers
+            batch: If given, the write is added to this list instead of being sent,
+                so several DataFrames can be flushed with one batch_write_sheets call
             
         Returns:
-            Dictionary containing the API response
+            Dictionary containing the API response (empty when buffered into batch)
         """
-        logger.debug(f"Writing DataFrame to sheet {spreadsheet_id}, shape: {df.shape}")
+        logger.debug("Writing DataFrame to sheet %s, shape: %s", spreadsheet_id, df.shape)
         values = []
         
         if include_header:
             values.append(df.columns.tolist())
         
-        # Convert DataFrame to list of lists
-        for _, row in df.iterrows():
-            values.append(row.tolist())
+        # Convert DataFrame to list of lists in one pass; missing values become
+        # empty cells since NaN is not valid JSON for the API
+        values.extend(df.astype(object).where(df.notna(), "").to_numpy().tolist())
         
+        if batch is not None:
+            batch.append((range_name, values))
+            return {}
         return self.write_sheet(spreadsheet_id, range_name, values)
     
     def append_to_sheet(self, spreadsheet_id: str, range_name: str, 
@@ -329,20 +963,24 @@ class GoogleSheetsClient:
             HttpError: If there's an error appending to the Google Sheet
         """
         try:
-            logger.debug(f"Appending to sheet {spreadsheet_id}, range: {range_name}, rows: {len(values)}")
+            logger.debug("Appending to sheet %s, range: %s, rows: %d", spreadsheet_id, range_name, len(values))
             body = {
                 'values': values
             }
             
-            result = self.service.spreadsheets().values().append(
+            # Insert whole rows and only ask for the update summary back
+            result = self._execute(self.service.spreadsheets().values().append(
                 spreadsheetId=spreadsheet_id,
                 range=range_name,
                 valueInputOption=value_input_option,
+                insertDataOption='INSERT_ROWS',
+                includeValuesInResponse=False,
+                fields='updates(updatedRange,updatedCells)',
                 body=body
-            ).execute()
+            ))
             
             updated_cells = result.get('updates', {}).get('updatedCells', 0)
-            logger.info(f"Successfully appended {updated_cells} cells to sheet")
+            logger.info("Successfully appended %s cells to sheet", updated_cells)
             return result
             
         except HttpError as error:
@@ -350,6 +988,28 @@ class GoogleSheetsClient:
             logger.error(error_msg)
             raise
     
+    def append_rows(self, spreadsheet_id: str, range_name: str,
+                    rows: Iterable[Sequence[Any]], value_input_option: str = "RAW") -> Dict[str, Any]:
+        """
+        Append many rows to a Google Sheet in a single request
+        
+        Args:
+            spreadsheet_id: The ID of the Google Sheet
+            range_name: The range to append to
+            rows: Rows to append, e.g. a generator of tuples
+            value_input_option: How to interpret the data
+            
+        Returns:
+            Dictionary containing the API response (empty if there were no rows)
+            
+        Raises:
+            HttpError: If there's an error appending to the Google Sheet
+        """
+        values = [list(row) for row in rows]
+        if not values:
+            return {}
+        return self.append_to_sheet(spreadsheet_id, range_name, values, value_input_option)
+    
     def clear_sheet(self, spreadsheet_id: str, range_name: str) -> Dict[str, Any]:
         """
         Clear data from a Google Sheet range
@@ -365,13 +1025,13 @@ class GoogleSheetsClient:
             HttpError: If there's an error clearing the Google Sheet
         """
         try:
-            logger.debug(f"Clearing sheet {spreadsheet_id}, range: {range_name}")
-            result = self.service.spreadsheets().values().clear(
+            logger.debug("Clearing sheet %s, range: %s", spreadsheet_id, range_name)
+            result = self._execute(self.service.spreadsheets().values().clear(
                 spreadsheetId=spreadsheet_id,
                 range=range_name
-            ).execute()
+            ))
             
-            logger.info(f"Successfully cleared range {range_name}")
+            logger.info("Successfully cleared range %s", range_name)
             return result
             
         except HttpError as error:
@@ -379,6 +1039,81 @@ class GoogleSheetsClient:
             logger.error(error_msg)
             raise
     
+    def get_sheet_id(self, spreadsheet_id: str, sheet_name: str) -> int:
+        """
+        Get the numeric sheetId of a sheet (tab), cached per client
+        
+        Args:
+            spreadsheet_id: The ID of the Google Sheet
+            sheet_name: Title of the sheet
+            
+        Returns:
+            The sheet's sheetId
+            
+        Raises:
+            ValueError: If the spreadsheet has no sheet with that title
+            HttpError: If there's an error accessing the Google Sheet
+        """
+        key = (spreadsheet_id, sheet_name)
+        if key not in self._sheet_ids:
+            result = self._execute(self.service.spreadsheets().get(
+                spreadsheetId=spreadsheet_id,
+                fields='sheets.properties(sheetId,title)'
+            ))
+            for sheet in result.get('sheets', []):
+                properties = sheet.get('properties', {})
+                self._sheet_ids[(spreadsheet_id, properties.get('title'))] = properties.get('sheetId', 0)
+            if key not in self._sheet_ids:
+                raise ValueError(f"Sheet '{sheet_name}' not found in spreadsheet {spreadsheet_id}")
+        return self._sheet_ids[key]
+    
+    def replace_range(self, spreadsheet_id: str, range_name: str, values: List[List[Any]]) -> Dict[str, Any]:
+        """
+        Clear a range and write new values into it with a single API call
+        
+        Uses one spreadsheets.batchUpdate updateCells request over the whole
+        range: cells covered by values are written and every other cell in the
+        range is cleared, replacing a clear_sheet + write_sheet round-trip pair.
+        Values are written as-is (like "RAW"); formulas are not evaluated.
+        
+        Args:
+            spreadsheet_id: The ID of the Google Sheet
+            range_name: Range including the sheet name (e.g., "Opgave!A2:I")
+            values: 2D list of values to write from the range's top-left cell
+            
+        Returns:
+            Dictionary containing the API response
+            
+        Raises:
+            ValueError: If range_name has no sheet name or can't be parsed
+            HttpError: If there's an error writing to the Google Sheet
+        """
+        sheet_name, _, cells = range_name.rpartition('!')
+        if not sheet_name:
+            raise ValueError(f"Range '{range_name}' must include a sheet name")
+        sheet_name = sheet_name.strip("'").replace("''", "'")
+        grid_range = _a1_to_grid_range(cells, self.get_sheet_id(spreadsheet_id, sheet_name))
+        rows = [{'values': [_cell_data(value) for value in row]} for row in values]
+        
+        try:
+            logger.debug("Replacing range %s in sheet %s, rows: %d", range_name, spreadsheet_id, len(values))
+            result = self._execute(self.service.spreadsheets().batchUpdate(
+                spreadsheetId=spreadsheet_id,
+                body={'requests': [{'updateCells': {
+                    'range': grid_range,
+                    'rows': rows,
+                    'fields': 'userEnteredValue',
+                }}]}
+            ))
+            
+            logger.info("Successfully replaced range %s", range_name)
+            return result
+            
+        except HttpError as error:
+            error_msg = f"Error replacing range: {error}"
+            logger.error(error_msg)
+            raise
+    
     def get_sheet_info(self, spreadsheet_id: str) -> Dict[str, Any]:
         """
         Get information about the spreadsheet
@@ -393,10 +1128,10 @@ class GoogleSheetsClient:
             HttpError: If there's an error accessing the Google Sheet
         """
         try:
-            logger.debug(f"Getting info for sheet {spreadsheet_id}")
-            result = self.service.spreadsheets().get(
+            logger.debug("Getting info for sheet %s", spreadsheet_id)
+            result = self._execute(self.service.spreadsheets().get(
                 spreadsheetId=spreadsheet_id
-            ).execute()
+            ))
             
             title = result.get('properties', {}).get('title', 'Unknown')
             sheets = [sheet['properties']['title'] for sheet in result.get('sheets', [])]
@@ -407,7 +1142,7 @@ class GoogleSheetsClient:
                 'spreadsheet_id': spreadsheet_id
             }
             
-            logger.info(f"Retrieved sheet info: {title} with {len(sheets)} sheets")
+            logger.info("Retrieved sheet info: %s with %d sheets", title, len(sheets))
             return info
             
         except HttpError as error:
@@ -416,6 +1151,85 @@ class GoogleSheetsClient:
             raise
 
 
+def _column_name(index: int) -> str:
+    """Convert a 0-based column index to column letters (0 -> "A", 27 -> "AB")"""
+    if index < len(_COL_NAMES):
+        return _COL_NAMES[index]
+    letters = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+
+# Column letters A..ZZ and their indexes, so range math is a table lookup
+_COL_NAMES = tuple(
+    [chr(ord('A') + i) for i in range(26)]
+    + [chr(ord('A') + i) + chr(ord('A') + j) for i in range(26) for j in range(26)]
+)
+_COL_INDEX = {name: index for index, name in enumerate(_COL_NAMES)}
+
+
+def _column_index(letters: str) -> int:
+    """Convert column letters ("A", "AB") to a 0-based column index"""
+    letters = letters.upper()
+    index = _COL_INDEX.get(letters)
+    if index is not None:
+        return index
+    index = 0
+    for letter in letters:
+        index = index * 26 + ord(letter) - ord('A') + 1
+    return index - 1
+
+
+def _a1_to_grid_range(cells: str, sheet_id: int) -> Dict[str, int]:
+    """
+    Convert the cell part of an A1 range to a Sheets API GridRange
+    
+    Omitted bounds stay open, so "A2:C" covers every row from 2 down.
+    
+    Args:
+        cells: A1 cells without the sheet name (e.g., "A2:I", "B5")
+        sheet_id: Numeric ID of the sheet the range belongs to
+        
+    Returns:
+        GridRange dictionary with 0-based, end-exclusive indexes
+        
+    Raises:
+        ValueError: If cells isn't a valid A1 range
+    """
+    match = _A1_RANGE_RE.match(cells)
+    if not match or not (match.group(1) or match.group(2)):
+        raise ValueError(f"Invalid A1 range '{cells}'")
+    start_col, start_row, end_col, end_row = match.groups()
+    if end_col is None and end_row is None:
+        # Single cell
+        end_col, end_row = start_col, start_row
+    grid_range = {'sheetId': sheet_id}
+    if start_col:
+        grid_range['startColumnIndex'] = _column_index(start_col)
+    if start_row:
+        grid_range['startRowIndex'] = int(start_row) - 1
+    if end_col:
+        grid_range['endColumnIndex'] = _column_index(end_col) + 1
+    if end_row:
+        grid_range['endRowIndex'] = int(end_row)
+    return grid_range
+
+
+def _cell_data(value: Any) -> Dict[str, Any]:
+    """Wrap a Python value as CellData for an updateCells request"""
+    if value is None or value == '':
+        return {}
+    if isinstance(value, bool):
+        return {'userEnteredValue': {'boolValue': value}}
+    if isinstance(value, (int, float)):
+        return {'userEnteredValue': {'numberValue': value}}
+    return {'userEnteredValue': {'stringValue': str(value)}}
+
+
+@lru_cache(maxsize=None)
 def extract_spreadsheet_id(url: str) -> str:
     """
     Extract spreadsheet ID from a Google Sheets URL
@@ -426,8 +1240,6 @@ def extract_spreadsheet_id(url: str) -> str:
     Returns:
         Spreadsheet ID
     """
-    if '/spreadsheets/d/' in url:
-        return url.split('/spreadsheets/d/')[1].split('/')[0]
-    else:
-        # Assume it's already an ID
-        return url
\ No newline at end of file
+    match = _SID_RE.search(url)
+    # Without a match assume it's already an ID
+    return match.group(1) if match else url
\ No newline at end of file
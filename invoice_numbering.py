@@ -0,0 +1,227 @@
+"""
+ST_Faktura Invoice Numbering
+
+Issues consecutive invoice numbers from a small JSON file. Kept apart from the
+PDF generation in invoice_utils so numbering-only callers never import ReportLab.
+"""
+
+import os
+import json
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
+
+from file_utils import atomic_write_bytes
+
+try:
+    import fcntl
+except ImportError:  # Windows: numbering falls back to unlocked read-modify-write
+    fcntl = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Invoice configuration
+NUMBERING_FILENAME = 'invoice_numbering.json'
+
+
+def invoice_data_dir() -> str:
+    """Directory for invoice data: $INVOICE_DATA_DIR, else the current working directory"""
+    return os.getenv('INVOICE_DATA_DIR') or os.getcwd()
+
+
+def invoice_numbering_file() -> str:
+    """
+    Path of the invoice numbering file
+    
+    Resolved on each call rather than at import, so $INVOICE_NUMBERING_FILE set
+    after import and a later chdir are both honoured.
+    """
+    return os.getenv('INVOICE_NUMBERING_FILE') or os.path.join(invoice_data_dir(), NUMBERING_FILENAME)
+
+
+def _loads_json(data: bytes) -> Any:
+    """Decode JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _dumps_json(obj: Any) -> bytes:
+    """Encode a value as compact UTF-8 JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+class InvoiceNumberManager:
+    """
+    Manages invoice numbering following clean architecture principles
+    """
+    
+    # Last known number per numbering file, with the file's (inode, mtime, size)
+    # when it was read or written; shared by all instances in the process
+    _number_cache: ClassVar[Dict[str, Tuple[Tuple[int, int, int], int]]] = {}
+    _cache_lock: ClassVar[threading.Lock] = threading.Lock()
+    
+    def __init__(self, config_file: Optional[str] = None):
+        """
+        Initialize invoice number manager
+        
+        Args:
+            config_file: Path to the invoice numbering configuration file
+                         (default: invoice_numbering_file())
+        """
+        config_file = config_file or invoice_numbering_file()
+        self.config_file = config_file
+        # Ensure directory exists once, up front; a bare filename has no directory
+        # part (makedirs('') would raise) and the lock file needs it before any save
+        directory = os.path.dirname(config_file)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+    
+    @contextmanager
+    def _numbering_lock(self):
+        """
+        Hold an exclusive lock on the numbering file for a read-modify-write
+        
+        The lock lives on a sidecar '.lock' file so the JSON file itself can still
+        be replaced freely; concurrent processes allocating numbers are serialized.
+        """
+        if fcntl is None:
+            yield
+            return
+        with open(f"{self.config_file}.lock", 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
+    def _file_signature(self) -> Optional[Tuple[int, int, int]]:
+        """Identify the numbering file's current contents without reading it"""
+        try:
+            st = os.stat(self.config_file)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+    
+    def _read_current_number(self) -> int:
+        """
+        Read the last issued invoice number (784 when no file exists, so next is 785)
+        
+        The parsed number is cached in memory and only re-read when the file's
+        signature changes, e.g. after another process issued a number.
+        """
+        signature = self._file_signature()
+        if signature is None:
+            return 784
+        cached = self._number_cache.get(self.config_file)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        with open(self.config_file, 'rb') as f:
+            config = _loads_json(f.read())
+        current_number = config.get('current_invoice_number', 784)
+        self._number_cache[self.config_file] = (signature, current_number)
+        return current_number
+        
+    def get_next_invoice_number(self) -> int:
+        """
+        Get the next invoice number
+        
+        The read, increment and save happen under an exclusive file lock, so two
+        processes generating invoices at once never receive the same number.
+        
+        Returns:
+            Next invoice number
+            
+        Raises:
+            OSError: If the numbering file can't be read or saved; callers must
+                abort rather than issue a number that may already be taken
+        """
+        try:
+            next_number = self._advance(1)
+        except Exception as e:
+            logger.error("Failed to get next invoice number: %s", e)
+            raise
+        
+        logger.info("Generated invoice number: %d", next_number)
+        return next_number
+
+    def reserve_invoice_numbers(self, count: int) -> List[int]:
+        """
+        Allocate count consecutive invoice numbers with a single locked save
+        
+        Meant for batch runs that know up front how many invoices they will issue.
+        Numbers are only taken on request and never read ahead, so the series
+        stays without gaps as long as the caller uses every number it reserved.
+        
+        Args:
+            count: How many invoice numbers to allocate
+            
+        Returns:
+            The allocated numbers in ascending order
+            
+        Raises:
+            ValueError: If count is less than 1
+            OSError: If the numbering file can't be read or saved; no numbers are
+                handed out then, so a failed save can't issue the same block twice
+        """
+        if count < 1:
+            raise ValueError(f"count must be at least 1, got {count}")
+        try:
+            last_number = self._advance(count)
+        except Exception as e:
+            logger.error("Failed to reserve %d invoice numbers: %s", count, e)
+            raise
+        
+        logger.info("Reserved invoice numbers %d-%d", last_number - count + 1, last_number)
+        return list(range(last_number - count + 1, last_number + 1))
+    
+    def _advance(self, count: int) -> int:
+        """
+        Move the counter forward by count under the file lock and return the new current number
+        
+        Raises:
+            OSError: If the new number could not be saved
+        """
+        with self._cache_lock, self._numbering_lock():
+            current_number = self._read_current_number() + count
+            self._save_invoice_number(current_number)
+        return current_number
+
+    def peek_next_invoice_number(self) -> int:
+        """Peek at what the next invoice number would be WITHOUT incrementing/persisting.
+
+        Returns:
+            int: The next invoice number (current + 1) best-effort. If any error occurs
+                 we fallback to 785 (the starting number in existing logic).
+        """
+        try:
+            return self._read_current_number() + 1
+        except Exception as e:
+            logger.warning("Failed to peek next invoice number, using fallback: %s", e)
+            return 785
+    
+    def _save_invoice_number(self, invoice_number: int) -> None:
+        """
+        Save the current invoice number to file
+        
+        Args:
+            invoice_number: Current invoice number to save
+            
+        Raises:
+            OSError: If the file could not be written; the cache is left unchanged
+        """
+        config = {'current_invoice_number': invoice_number}
+        
+        atomic_write_bytes(self.config_file, _dumps_json(config))
+        # Write through so the next call needn't re-read what we just wrote
+        self._number_cache[self.config_file] = (self._file_signature(), invoice_number)
+        
+        logger.debug("Saved invoice number: %d", invoice_number)
@@ -5,19 +5,33 @@ This module provides utilities for generating PDF invoices and managing invoice
 Following copilot instructions for cross-platform compatibility, proper logging, and clean architecture.
 """
 
+import io
 import os
-import json
+import html
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+import logging.handlers
+import multiprocessing.queues
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
+import numpy as np
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Flowable
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
 from reportlab.lib.units import cm
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.lib.enums import TA_LEFT, TA_RIGHT, TA_CENTER
 
+from file_utils import write_bytes
+# Re-exported so existing 'from invoice_utils import InvoiceNumberManager' imports keep working
+from invoice_numbering import InvoiceNumberManager, invoice_data_dir, invoice_numbering_file
+
 # Unified content width (page width minus left/right margins: 2cm each)
 CONTENT_SIDE_MARGIN = 2.0 * cm
 CONTENT_WIDTH = A4[0] - (CONTENT_SIDE_MARGIN * 2)
@@ -25,91 +39,269 @@ CONTENT_WIDTH = A4[0] - (CONTENT_SIDE_MARGIN * 2)
 logger = logging.getLogger(__name__)
 
 # Invoice configuration
-INVOICE_NUMBERING_FILE = os.path.join(os.getcwd(), 'invoice_numbering.json')
-INVOICES_DIR = os.path.join(os.getcwd(), 'invoices')
+INVOICES_DIRNAME = 'invoices'
 
 
-class InvoiceNumberManager:
+def invoices_dir() -> str:
+    """
+    Output directory for generated invoice PDFs: 'invoices' in invoice_data_dir()
+    
+    $INVOICES_DIR is deliberately not used here: api.py points it at the archive
+    served by /invoices/search, and previews must not land there.
     """
-    Manages invoice numbering following clean architecture principles
+    return os.path.join(invoice_data_dir(), INVOICES_DIRNAME)
+
+# Company detail keys shown in the page footer, in InvoicePDFGenerator._footer_lines order
+FOOTER_FIELDS = (
+    'company_name', 'company_address', 'company_zip', 'company_town', 'company_cvr',
+    'company_phone', 'company_email', 'bank_name', 'bank_account', 'iban', 'swift',
+    'additional_info',
+)
+
+# Table styles and column widths are fixed for the template, so they are built
+# once at import and shared by every invoice (setStyle only reads them)
+_NO_PADDING = [
+    ('LEFTPADDING', (0,0), (-1,-1), 0),
+    ('RIGHTPADDING', (0,0), (-1,-1), 0),
+    ('TOPPADDING', (0,0), (-1,-1), 0),
+    ('BOTTOMPADDING', (0,0), (-1,-1), 0),
+]
+# Thin horizontal rule under the header
+RULE_TABLE_STYLE = TableStyle([('LINEBELOW', (0,0), (-1,0), 0.5, colors.black)] + _NO_PADDING)
+# Logo/brand + invoice meta block on the right of the header
+HEADER_BRAND_TABLE_STYLE = TableStyle([
+    ('ALIGN', (0,0), (-1,-1), 'RIGHT'),
+    ('VALIGN', (0,0), (-1,-1), 'TOP'),
+] + _NO_PADDING)
+# Customer block | brand block
+HEADER_TABLE_STYLE = TableStyle([
+    ('VALIGN', (0,0), (-1,-1), 'TOP'),
+    ('ALIGN', (1,0), (1,0), 'RIGHT'),
+] + _NO_PADDING)
+PAYMENT_TABLE_STYLE = TableStyle([
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('TOPPADDING', (0, 0), (-1, -1), 20),
+])
+
+_ITEMS_BASE_STYLE = [
+    ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+    ('BACKGROUND', (0,0), (-1,0), colors.whitesmoke),
+    ('LINEBELOW', (0,0), (-1,0), 0.5, colors.black),
+    ('VALIGN', (0,0), (-1,-1), 'TOP'),
+    # Header slightly larger than body
+    ('FONTSIZE', (0,0), (-1,0), 9),
+    ('FONTSIZE', (0,1), (-1,-1), 8),
+    ('TOPPADDING', (0,0), (-1,0), 4),
+    ('BOTTOMPADDING', (0,0), (-1,0), 4),
+    ('TOPPADDING', (0,1), (-1,-1), 2),
+    ('BOTTOMPADDING', (0,1), (-1,-1), 2),
+]
+# Columns: 0 tasktype,1 desc,2 min,3 price,4 discount,5 sum
+ITEMS_TABLE_STYLE_DISCOUNT = TableStyle(_ITEMS_BASE_STYLE + [
+    ('ALIGN', (2,1), (2,-3), 'RIGHT'),
+    ('ALIGN', (3,1), (5,-1), 'RIGHT'),
+    ('LINEABOVE', (4,-2), (5,-2), 0.5, colors.black),
+    ('FONTNAME', (4,-1), (5,-1), 'Helvetica-Bold'),
+])
+# Columns: 0 tasktype,1 desc,2 min,3 price,4 sum
+ITEMS_TABLE_STYLE = TableStyle(_ITEMS_BASE_STYLE + [
+    ('ALIGN', (2,1), (2,-3), 'RIGHT'),
+    ('ALIGN', (3,1), (4,-1), 'RIGHT'),
+    ('LINEABOVE', (3,-2), (4,-2), 0.5, colors.black),
+    ('FONTNAME', (3,-1), (4,-1), 'Helvetica-Bold'),
+])
+# Column width proportions originally based on 18cm total; without the discount
+# column its share goes to the description and sum columns
+ITEMS_COL_WIDTHS_DISCOUNT = [CONTENT_WIDTH * f for f in (0.1667, 0.3333, 0.1222, 0.1222, 0.1222, 0.1334)]
+ITEMS_COL_WIDTHS = [CONTENT_WIDTH * f for f in (0.18, 0.38, 0.14, 0.14, 0.16)]
+# Very light grey behind every other task row
+ITEMS_STRIPE_COLOR = colors.Color(0.95, 0.95, 0.95)
+ITEMS_HEADERS = ['Tasktype', 'Task description', 'Min. forbrugt', 'Pris', 'Sum']
+ITEMS_HEADERS_DISCOUNT = ['Tasktype', 'Task description', 'Min. forbrugt', 'Pris', 'Discount %', 'Sum']
+# Items table rows of an invoice without tasks: header plus zero VAT and total
+_EMPTY_ITEMS_ROWS = (
+    ITEMS_HEADERS,
+    ['', '', '', 'Moms (25%)', '0.00'],
+    ['', '', '', 'Samlet pris', '0.00'],
+)
+
+
+@lru_cache(maxsize=1)
+def _html_backend() -> Optional[Tuple[Any, Any]]:
     """
+    Import (jinja2, weasyprint) for the HTML backend on first use, or None if unavailable
     
-    def __init__(self, config_file: str = INVOICE_NUMBERING_FILE):
-        """
-        Initialize invoice number manager
-        
-        Args:
-            config_file: Path to the invoice numbering configuration file
-        """
-        self.config_file = config_file
-        
-    def get_next_invoice_number(self) -> int:
-        """
-        Get the next invoice number
-        
-        Returns:
-            Next invoice number
-        """
-        try:
-            # Load current invoice number
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                current_number = config.get('current_invoice_number', 784)
-            else:
-                current_number = 784  # Start from 784 so next is 785
-            
-            # Increment and save
-            next_number = current_number + 1
-            self._save_invoice_number(next_number)
-            
-            logger.info(f"Generated invoice number: {next_number}")
-            return next_number
-            
-        except Exception as e:
-            logger.error(f"Failed to get next invoice number: {e}")
-            # Fallback to starting number
-            return 785
+    Imported lazily so the ReportLab path never pays for (or prints warnings from)
+    weasyprint, which raises OSError when the Pango libraries are missing.
+    """
+    try:
+        import jinja2
+        import weasyprint
+    except (ImportError, OSError):
+        return None
+    return jinja2, weasyprint
 
-    def peek_next_invoice_number(self) -> int:
-        """Peek at what the next invoice number would be WITHOUT incrementing/persisting.
 
-        Returns:
-            int: The next invoice number (current + 1) best-effort. If any error occurs
-                 we fallback to 785 (the starting number in existing logic).
-        """
-        try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                current_number = config.get('current_invoice_number', 784)
-            else:
-                current_number = 784
-            return current_number + 1
-        except Exception as e:
-            logger.warning(f"Failed to peek next invoice number, using fallback: {e}")
-            return 785
+# Jinja2 template for the HTML backend; mirrors the ReportLab layout
+_INVOICE_HTML_TEMPLATE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><style>
+@page { size: A4; margin: 2cm 2cm 3cm 2cm;
+        @bottom-center { content: element(footer); } }
+body { font-family: Helvetica, Arial, sans-serif; font-size: 9pt; }
+.header { display: flex; justify-content: space-between; border-bottom: 0.5pt solid black; padding-bottom: 4pt; }
+.brand { width: 6.5cm; text-align: right; }
+.brand img { height: 40pt; }
+.brand .name { font-size: 20pt; font-weight: bold; }
+h1 { font-size: 9pt; margin: 16pt 0 18pt 0; }
+table.items { width: 100%; border-collapse: collapse; font-size: 8pt; }
+table.items th { background: whitesmoke; font-size: 9pt; text-align: left; border-bottom: 0.5pt solid black; padding: 4pt 2pt; }
+table.items td { padding: 2pt; vertical-align: top; }
+table.items tbody tr:nth-child(odd) td { background: #f2f2f2; }
+table.items .num { text-align: right; }
+table.items tfoot td { text-align: right; }
+table.items tfoot tr:first-child td.sum { border-top: 0.5pt solid black; }
+table.items tfoot tr:last-child td.sum { font-weight: bold; }
+.payment { margin-top: 45pt; }
+footer { position: running(footer); font-size: 8pt; text-align: center; border-top: 0.5pt solid black; padding-top: 4pt; }
+</style></head><body>
+<footer>{% for line in footer_lines %}{{ line }}<br/>{% endfor %}</footer>
+<div class="header">
+  <div>{{ customer_block|safe }}</div>
+  <div class="brand">
+    {% if logo_uri %}<img src="{{ logo_uri }}"/>{% else %}<div class="name">{{ company_name }}</div>{% endif %}
+    <div>{{ date_label }}: {{ invoice_date }}<br/>{{ number_label }}: {{ invoice_number }}</div>
+  </div>
+</div>
+<h1>{{ title }}</h1>
+<table class="items">
+  <thead><tr>{% for h in headers %}<th>{{ h }}</th>{% endfor %}</tr></thead>
+  <tbody>{% for row in rows %}<tr>
+    <td>{{ row[0] }}</td><td>{{ row[1] }}</td>{% for cell in row[2:] %}<td class="num">{{ cell }}</td>{% endfor %}
+  </tr>{% endfor %}</tbody>
+  <tfoot>
+    <tr><td colspan="{{ headers|length - 1 }}">Moms (25%)</td><td class="sum">{{ moms }}</td></tr>
+    <tr><td colspan="{{ headers|length - 1 }}">Samlet pris</td><td class="sum">{{ total }}</td></tr>
+  </tfoot>
+</table>
+<div class="payment">{{ payment_info|safe }}</div>
+</body></html>
+"""
+
+# Name of the per-document form XObject holding the page footer
+FOOTER_FORM_NAME = 'InvoiceFooter'
+
+# PDF backend for generate_invoice_pdf: "reportlab" (default) or "html" (WeasyPrint)
+PDF_BACKEND = os.getenv('INVOICE_PDF_BACKEND', 'reportlab').strip().lower()
+
+# Danish VAT applied to the invoice subtotal
+VAT_RATE = 0.25
+
+
+# Two-decimal amount formatter, bound once instead of parsing a format spec per call
+_format_amount = "{:.2f}".format
+
+
+# Last invoices directory created, so later invoices skip the makedirs
+_dirs_ready: Optional[str] = None
+
+
+def _ensure_dirs() -> str:
+    """Create invoices_dir() once per distinct path and return it"""
+    global _dirs_ready
+    directory = invoices_dir()
+    if _dirs_ready != directory:
+        os.makedirs(directory, exist_ok=True)
+        _dirs_ready = directory
+    return directory
+
+
+def _amount(value) -> float:
+    """Parse a task amount cell; blank or non-numeric cells count as 0"""
+    try:
+        return float(value) if value else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _has_discount(tasks: List[Dict[str, str]]) -> bool:
+    """True if any task has a discount (non-empty and not 0 or 0.0)"""
+    for t in tasks:
+        d_raw = str(t.get('discount_percentage', '')).strip()
+        if d_raw and d_raw not in ('0', '0.0', '0.00'):
+            try:
+                if float(d_raw) != 0.0:
+                    return True
+            except ValueError:
+                # If non-numeric but present, consider it a discount marker
+                return True
+    return False
+
+
+def _invoice_totals(tasks: List[Dict[str, str]]) -> Tuple[float, float, float]:
+    """(subtotal, VAT, total) of the task sums, summed in one pass and rounded to whole øre"""
+    if not tasks:
+        return 0.0, 0.0, 0.0
+    sums = np.fromiter((_amount(t.get('sum','0')) for t in tasks), dtype=np.float64, count=len(tasks))
+    subtotal = float(np.round(sums.sum(), 2))
+    moms = float(np.round(subtotal * VAT_RATE, 2))
+    return subtotal, moms, subtotal + moms
+
+
+def _credit_memo_tasks(tasks: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Copies of tasks with sum and price negated, for a credit memo"""
+    # Negate all sums and prices in one pass; 0.0 - x keeps zero amounts at 0.00, not -0.00
+    inv_sums = 0.0 - np.fromiter((_amount(t.get('sum', 0)) for t in tasks), dtype=np.float64, count=len(tasks))
+    inv_prices = 0.0 - np.fromiter((_amount(t.get('price', 0)) for t in tasks), dtype=np.float64, count=len(tasks))
+    return [
+        dict(t, sum=inv_sum, price=inv_price)
+        for t, inv_sum, inv_price in zip(tasks, map(_format_amount, inv_sums.tolist()), map(_format_amount, inv_prices.tolist()))
+    ]
+
+
+@lru_cache(maxsize=64)
+def _format_date(day: date, fmt: str) -> str:
+    """strftime for a calendar day, cached since a batch of invoices shares the same few dates"""
+    return day.strftime(fmt)
+
+
+def _invoice_filepath(invoice_number: int, invoice_date: datetime, credit_memo: bool) -> str:
+    """Output path of an invoice or credit memo PDF in invoices_dir(), creating the directory if needed"""
+    filename_prefix = 'kreditnota' if credit_memo else 'faktura'
+    return os.path.join(_ensure_dirs(), f"{filename_prefix}_{invoice_number}_{_format_date(invoice_date.date(), '%Y%m%d')}.pdf")
+
+
+class _PageMarker(Flowable):
+    """Zero-size flowable that records the page number it is drawn on"""
     
-    def _save_invoice_number(self, invoice_number: int) -> None:
-        """
-        Save the current invoice number to file
-        
-        Args:
-            invoice_number: Current invoice number to save
-        """
-        try:
-            config = {'current_invoice_number': invoice_number}
-            
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
-            
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
-            
-            logger.debug(f"Saved invoice number: {invoice_number}")
-            
-        except Exception as e:
-            logger.error(f"Failed to save invoice number: {e}")
+    def __init__(self, pages: List[int]):
+        super().__init__()
+        self.pages = pages
+    
+    def wrap(self, availWidth, availHeight):
+        return 0, 0
+    
+    def draw(self):
+        self.pages.append(self.canv.getPageNumber())
+
+
+class _Logo(Flowable):
+    """Logo scaled to a fixed height, drawn from a shared decoded ImageReader"""
+    
+    def __init__(self, reader: ImageReader, height: float):
+        super().__init__()
+        self.reader = reader
+        image_width, image_height = reader.getSize()
+        aspect = image_width / float(image_height) if image_height else 1.0
+        self.drawHeight = height
+        self.drawWidth = height * aspect
+    
+    def wrap(self, availWidth, availHeight):
+        return self.drawWidth, self.drawHeight
+    
+    def draw(self):
+        self.canv.drawImage(self.reader, 0, 0, self.drawWidth, self.drawHeight, mask='auto')
 
 
 class InvoicePDFGenerator:
@@ -118,20 +310,53 @@ class InvoicePDFGenerator:
     Matches the ST Digital invoice template design
     """
     
+    # Decoded logo images by (path, mtime), shared by all generators
+    _logo_cache: ClassVar[Dict[Tuple[str, int], ImageReader]] = {}
+    
+    # Stylesheet shared by all generators, built on first use by _build_styles
+    _styles_cache: ClassVar[Optional[StyleSheet1]] = None
+    _styles_lock: ClassVar[threading.Lock] = threading.Lock()
+    
     def __init__(self):
         """Initialize PDF generator"""
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
+        self.styles = type(self)._build_styles()
         
         # Ensure invoices directory exists
-        os.makedirs(INVOICES_DIR, exist_ok=True)
+        _ensure_dirs()
+    
+    @classmethod
+    def _logo_reader(cls, logo_path: str) -> ImageReader:
+        """Decoded logo for logo_path, re-read only when the file changes"""
+        key = (logo_path, os.stat(logo_path).st_mtime_ns)
+        reader = cls._logo_cache.get(key)
+        if reader is None:
+            reader = cls._logo_cache[key] = ImageReader(logo_path)
+        return reader
     
-    def _setup_custom_styles(self) -> None:
-        """Set up custom paragraph styles matching the template"""
+    @classmethod
+    def _build_styles(cls) -> StyleSheet1:
+        """
+        Build the sample stylesheet plus the template's custom styles once
+        
+        The styles are only read after construction, so every generator in the
+        process shares the same StyleSheet1 instead of rebuilding it.
+        """
+        if cls._styles_cache is not None:
+            return cls._styles_cache
+        with cls._styles_lock:
+            if cls._styles_cache is None:
+                cls._styles_cache = cls._create_styles()
+            return cls._styles_cache
+    
+    @staticmethod
+    def _create_styles() -> StyleSheet1:
+        """Create the sample stylesheet with the template's custom paragraph styles added"""
+        styles = getSampleStyleSheet()
+        
         # Company name style (left side)
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='CompanyName',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=11,
             textColor=colors.black,
             alignment=TA_LEFT,
@@ -139,9 +364,9 @@ class InvoicePDFGenerator:
         ))
         
         # Company details style
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='CompanyDetails',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=9,
             textColor=colors.black,
             alignment=TA_LEFT,
@@ -149,9 +374,9 @@ class InvoicePDFGenerator:
         ))
         
         # Logo/Company brand style (right side)
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='CompanyBrand',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=24,
             textColor=colors.black,
             alignment=TA_RIGHT,
@@ -159,9 +384,9 @@ class InvoicePDFGenerator:
         ))
         
         # Invoice title style
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='InvoiceTitle',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=16,
             textColor=colors.black,
             alignment=TA_RIGHT,
@@ -170,9 +395,9 @@ class InvoicePDFGenerator:
         ))
         
         # Invoice info style
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='InvoiceInfo',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=9,
             textColor=colors.black,
             alignment=TA_LEFT,
@@ -180,9 +405,9 @@ class InvoicePDFGenerator:
         ))
         
         # Table header style
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='TableHeader',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=9,
             textColor=colors.black,
             alignment=TA_LEFT,
@@ -190,19 +415,19 @@ class InvoicePDFGenerator:
         ))
         
         # Footer style
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='Footer',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=8,
             textColor=colors.black,
             alignment=TA_CENTER,
             fontName='Helvetica'
         ))
         # Description (wrapping) style for task descriptions in table
-        if 'TaskDescription' not in self.styles:
-            self.styles.add(ParagraphStyle(
+        if 'TaskDescription' not in styles:
+            styles.add(ParagraphStyle(
                 name='TaskDescription',
-                parent=self.styles['Normal'],
+                parent=styles['Normal'],
                 fontSize=8,
                 leading=10,
                 alignment=TA_LEFT,
@@ -210,6 +435,7 @@ class InvoicePDFGenerator:
                 allowWidows=1,
                 allowOrphans=1,
             ))
+        return styles
     
     def generate_invoice_pdf(
         self,
@@ -234,68 +460,227 @@ class InvoicePDFGenerator:
         Returns:
             Path to generated PDF file
         """
+        if PDF_BACKEND == 'html':
+            if _html_backend() is not None:
+                return self.generate_invoice_pdf_html(
+                    invoice_number, company_details, customer_details, tasks,
+                    hourly_rate, credit_memo, invoice_date_override
+                )
+            logger.warning("INVOICE_PDF_BACKEND=html needs jinja2 and weasyprint; using ReportLab")
+        
         # Modified to use new layout
         # If this is a credit memo, invert task sums and prices
         if credit_memo:
-            formatted_tasks: List[Dict[str, str]] = []
-            for t in tasks:
-                try:
-                    inv_sum = -float(t.get('sum', 0))
-                except:
-                    inv_sum = 0.0
-                try:
-                    inv_price = -float(t.get('price', 0))
-                except:
-                    inv_price = 0.0
-                new_task = dict(t)
-                new_task['sum'] = f"{inv_sum:.2f}"
-                new_task['price'] = f"{inv_price:.2f}"
-                formatted_tasks.append(new_task)
-            tasks = formatted_tasks
+            tasks = _credit_memo_tasks(tasks)
 
         try:
             invoice_date = invoice_date_override or datetime.now()
-            filename_prefix = 'kreditnota' if credit_memo else 'faktura'
-            filename = f"{filename_prefix}_{invoice_number}_{invoice_date.strftime('%Y%m%d')}.pdf"
-            filepath = os.path.join(INVOICES_DIR, filename)
-            logger.info(f"Generating invoice PDF (new layout): {filename}")
-            doc = SimpleDocTemplate(
-                filepath,
-                pagesize=A4,
-                rightMargin=2.0*cm,
-                leftMargin=2.0*cm,
-                topMargin=2.0*cm,
-                bottomMargin=2.0*cm
-            )
+            filepath = _invoice_filepath(invoice_number, invoice_date, credit_memo)
+            logger.info("Generating invoice PDF (new layout): %s", os.path.basename(filepath))
+            # Build in memory; the finished PDF is written to disk in one go
+            buffer = io.BytesIO()
+            story = self._invoice_story(invoice_number, invoice_date, company_details, customer_details, tasks, credit_memo)
+            self._build_document(buffer, story, company_details)
+            write_bytes(filepath, buffer.getbuffer())
+            logger.info("Invoice PDF generated successfully: %s", filepath)
+            return filepath
+        except Exception as e:
+            logger.error("Failed to generate invoice PDF: %s", e)
+            raise
+
+    def generate_invoices_pdf(
+        self,
+        company_details: Dict[str, str],
+        invoices: List[Tuple[int, Dict[str, str], List[Dict[str, str]]]],
+        credit_memo: bool = False,
+        invoice_date_override: Optional[datetime] = None
+    ) -> List[str]:
+        """
+        Generate several invoices from one company with a single ReportLab build
+        
+        The invoices are laid out as one document, separated by page breaks, and
+        the result is split into one PDF per invoice with PyPDF2. Without PyPDF2,
+        or with the HTML backend selected, each invoice is generated on its own.
+        
+        Args:
+            company_details: Company information, shared by all invoices
+            invoices: (invoice_number, customer_details, tasks) tuples, one per invoice
+            credit_memo: Generate credit memos instead of invoices
+            invoice_date_override: Date for all invoices (default: today)
+            
+        Returns:
+            Paths to the generated PDF files, in the same order as invoices
+        """
+        try:
+            from PyPDF2 import PdfReader, PdfWriter
+        except ImportError:
+            PdfReader = PdfWriter = None
+        if PdfWriter is None or PDF_BACKEND == 'html':
+            return [
+                self.generate_invoice_pdf(invoice_number, company_details, customer_details, tasks,
+                                          credit_memo=credit_memo, invoice_date_override=invoice_date_override)
+                for invoice_number, customer_details, tasks in invoices
+            ]
+        if not invoices:
+            return []
+        
+        try:
+            invoice_date = invoice_date_override or datetime.now()
+            logger.info("Generating %d invoice PDFs in one build", len(invoices))
+            # First page number of every invoice, recorded while the document is laid out
+            first_pages: List[int] = []
             story = []
-            story.append(self._create_new_header(invoice_number, invoice_date, company_details, customer_details, credit_memo=credit_memo))
-            # Thin horizontal rule under header
-            from reportlab.platypus import Table as RLTable
-            rule_table = RLTable([[" "]], colWidths=[CONTENT_WIDTH], rowHeights=[2])
-            rule_table.setStyle(TableStyle([
-                ('LINEBELOW', (0,0), (-1,0), 0.5, colors.black),
-                ('LEFTPADDING', (0,0), (-1,-1), 0),
-                ('RIGHTPADDING', (0,0), (-1,-1), 0),
-                ('TOPPADDING', (0,0), (-1,-1), 0),
-                ('BOTTOMPADDING', (0,0), (-1,-1), 0),
-            ]))
-            story.append(rule_table)
-            story.append(Spacer(1, 16))  # Slightly larger gap after rule
-            # Insert title above items table: 'Faktura' or 'Kreditnota'
-            from reportlab.platypus import Paragraph
-            title_text = "Kreditnota" if credit_memo else "Faktura"
-            story.append(Paragraph(f"<para alignment='left'><b>{title_text}</b></para>", self.styles['InvoiceInfo']))
-            story.append(Spacer(1, 18))  # More space between title and items table per request
-            story.append(self._create_new_items_table(tasks, company_details))
-            story.append(Spacer(1, 25))
-            story.append(self._create_payment_section(company_details, invoice_date, invoice_number, credit_memo=credit_memo))
-            def add_page_elements(canvas, doc):
-                self._draw_page_elements(canvas, doc, company_details)
-            doc.build(story, onFirstPage=add_page_elements, onLaterPages=add_page_elements)
-            logger.info(f"Invoice PDF generated successfully: {filepath}")
+            for invoice_number, customer_details, tasks in invoices:
+                if story:
+                    story.append(PageBreak())
+                story.append(_PageMarker(first_pages))
+                if credit_memo:
+                    tasks = _credit_memo_tasks(tasks)
+                story.extend(self._invoice_story(invoice_number, invoice_date, company_details, customer_details, tasks, credit_memo))
+            buffer = io.BytesIO()
+            self._build_document(buffer, story, company_details)
+            
+            reader = PdfReader(buffer)
+            page_ends = first_pages[1:] + [len(reader.pages) + 1]
+            filepaths = []
+            for (invoice_number, _, _), first_page, end_page in zip(invoices, first_pages, page_ends):
+                writer = PdfWriter()
+                for page in reader.pages[first_page - 1:end_page - 1]:
+                    writer.add_page(page)
+                output = io.BytesIO()
+                writer.write(output)
+                filepath = _invoice_filepath(invoice_number, invoice_date, credit_memo)
+                write_bytes(filepath, output.getbuffer())
+                filepaths.append(filepath)
+            logger.info("Generated %d invoice PDFs", len(filepaths))
+            return filepaths
+        except Exception as e:
+            logger.error("Failed to generate invoice PDFs: %s", e)
+            raise
+
+    def _invoice_story(self, invoice_number: int, invoice_date: datetime, company_details: Dict[str, str], customer_details: Dict[str, str], tasks: List[Dict[str, str]], credit_memo: bool) -> List[Flowable]:
+        """Flowables for one invoice: header, rule, title, items table and payment section"""
+        story = []
+        story.append(self._create_new_header(invoice_number, invoice_date, company_details, customer_details, credit_memo=credit_memo))
+        # Thin horizontal rule under header
+        rule_table = Table([[" "]], colWidths=[CONTENT_WIDTH], rowHeights=[2])
+        rule_table.setStyle(RULE_TABLE_STYLE)
+        story.append(rule_table)
+        story.append(Spacer(1, 16))  # Slightly larger gap after rule
+        # Insert title above items table: 'Faktura' or 'Kreditnota'
+        title_text = "Kreditnota" if credit_memo else "Faktura"
+        story.append(Paragraph(f"<para alignment='left'><b>{title_text}</b></para>", self.styles['InvoiceInfo']))
+        story.append(Spacer(1, 18))  # More space between title and items table per request
+        story.append(self._create_new_items_table(tasks, company_details))
+        story.append(Spacer(1, 25))
+        story.append(self._create_payment_section(company_details, invoice_date, invoice_number, credit_memo=credit_memo))
+        return story
+
+    def _build_document(self, buffer: io.BytesIO, story: List[Flowable], company_details: Dict[str, str]) -> None:
+        """Lay out story as an A4 document into buffer, with the page footer on every page"""
+        doc = SimpleDocTemplate(
+            buffer,
+            pagesize=A4,
+            rightMargin=2.0*cm,
+            leftMargin=2.0*cm,
+            topMargin=2.0*cm,
+            bottomMargin=2.0*cm
+        )
+        def add_page_elements(canvas, doc):
+            self._draw_page_elements(canvas, doc, company_details)
+        doc.build(story, onFirstPage=add_page_elements, onLaterPages=add_page_elements)
+
+    def generate_batch(self, jobs: List[Tuple[int, Dict[str, str], Dict[str, str], List[Dict[str, str]], float]]) -> List[str]:
+        """
+        Generate several invoice PDFs in parallel worker processes
+        
+        Args:
+            jobs: (invoice_number, company_details, customer_details, tasks, hourly_rate)
+                  tuples, one per invoice
+            
+        Returns:
+            Paths to the generated PDF files, in the same order as jobs
+        """
+        keys = ('invoice_number', 'company_details', 'customer_details', 'tasks', 'hourly_rate')
+        return generate_invoices_bulk([dict(zip(keys, job)) for job in jobs])
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _html_template():
+        """Compile the invoice HTML template once per process"""
+        jinja2, _ = _html_backend()
+        return jinja2.Environment(autoescape=True).from_string(_INVOICE_HTML_TEMPLATE)
+    
+    def generate_invoice_pdf_html(
+        self,
+        invoice_number: int,
+        company_details: Dict[str, str],
+        customer_details: Dict[str, str],
+        tasks: List[Dict[str, str]],
+        hourly_rate: float = 500.0,
+        credit_memo: bool = False,
+        invoice_date_override: Optional[datetime] = None
+    ) -> str:
+        """
+        Generate the invoice PDF from an HTML template with WeasyPrint
+        
+        Same layout and arguments as generate_invoice_pdf; used by it when
+        INVOICE_PDF_BACKEND=html.
+        
+        Returns:
+            Path to generated PDF file
+            
+        Raises:
+            RuntimeError: If jinja2 or weasyprint isn't installed
+        """
+        backend = _html_backend()
+        if backend is None:
+            raise RuntimeError("The HTML invoice backend requires jinja2 and weasyprint")
+        if credit_memo:
+            tasks = _credit_memo_tasks(tasks)
+        
+        try:
+            invoice_date = invoice_date_override or datetime.now()
+            filepath = _invoice_filepath(invoice_number, invoice_date, credit_memo)
+            logger.info("Generating invoice PDF (HTML backend): %s", os.path.basename(filepath))
+            
+            any_discount = _has_discount(tasks)
+            if any_discount:
+                headers = ['Tasktype', 'Task description', 'Min. forbrugt', 'Pris', 'Discount %', 'Sum']
+                columns = ('tasktype', 'description', 'time_minutes', 'price', 'discount_percentage', 'sum')
+            else:
+                headers = ['Tasktype', 'Task description', 'Min. forbrugt', 'Pris', 'Sum']
+                columns = ('tasktype', 'description', 'time_minutes', 'price', 'sum')
+            _, moms, total = _invoice_totals(tasks)
+            logo_path = os.path.join(os.getcwd(), 'logo.gif')
+            
+            html_doc = self._html_template().render(
+                title="Kreditnota" if credit_memo else "Faktura",
+                date_label='Kreditnotadato' if credit_memo else 'Fakturadato',
+                number_label='Kreditnotanr.' if credit_memo else 'Fakturanr.',
+                invoice_number=invoice_number,
+                invoice_date=_format_date(invoice_date.date(), '%d.%m.%Y'),
+                customer_block=self._customer_block(
+                    customer_details.get('name', ''),
+                    customer_details.get('address', ''),
+                    customer_details.get('zip', ''),
+                    customer_details.get('town', ''),
+                ),
+                company_name=company_details.get('company_name', 'ST Digital'),
+                logo_uri=Path(logo_path).as_uri() if os.path.exists(logo_path) else None,
+                headers=headers,
+                rows=[[t.get(column, '') or '' for column in columns] for t in tasks],
+                moms=_format_amount(moms),
+                total=_format_amount(total),
+                payment_info=self._payment_info_markup(company_details, invoice_date, invoice_number, credit_memo=credit_memo),
+                footer_lines=[line for _, line in self._footer_lines(tuple(company_details.get(field, '') for field in FOOTER_FIELDS))],
+            )
+            _, weasyprint = backend
+            write_bytes(filepath, weasyprint.HTML(string=html_doc).write_pdf())
+            logger.info("Invoice PDF generated successfully: %s", filepath)
             return filepath
         except Exception as e:
-            logger.error(f"Failed to generate invoice PDF: {e}")
+            logger.error("Failed to generate invoice PDF: %s", e)
             raise
 
     def _create_new_header(self, invoice_number: int, invoice_date: datetime, company_details: Dict[str, str], customer_details: Dict[str, str], credit_memo: bool = False) -> Table:
@@ -305,27 +690,21 @@ class InvoicePDFGenerator:
         right_col_width = 6.5 * cm  # Fixed width ensures consistent alignment with items table
         left_col_width = total_content_width - right_col_width
 
-        # Build customer block (filter out empty lines) with bold company/customer name (first line)
-        raw_name = customer_details.get('name', '')
-        name_line = f"<b>{raw_name}</b>" if raw_name else ''
-        customer_block_lines = [
-            name_line,
+        customer_block = self._customer_block(
+            customer_details.get('name', ''),
             customer_details.get('address', ''),
-            f"{customer_details.get('zip','')} {customer_details.get('town','')}".strip()
-        ]
-        customer_block = '<br/>'.join([l for l in customer_block_lines if l])
+            customer_details.get('zip', ''),
+            customer_details.get('town', ''),
+        )
 
         # Attempt to load logo.gif; if not present fallback to text brand
         logo_path = os.path.join(os.getcwd(), 'logo.gif')
         brand_block_flowables = []
         if os.path.exists(logo_path):
             try:
-                img = Image(logo_path)
+                # Reuse the decoded logo across invoices instead of re-reading the GIF
                 target_height = 40  # doubled (100% bigger) per request
-                aspect = img.imageWidth / float(img.imageHeight) if img.imageHeight else 1.0
-                img.drawHeight = target_height
-                img.drawWidth = target_height * aspect
-                brand_block_flowables.append(img)
+                brand_block_flowables.append(_Logo(self._logo_reader(logo_path), target_height))
             except Exception:
                 logo_text = company_details.get('company_name', 'ST Digital')
                 brand_block_flowables.append(Paragraph(f"<font size='20'><b>{logo_text}</b></font>", self.styles['CompanyDetails']))
@@ -337,7 +716,7 @@ class InvoicePDFGenerator:
         date_label = 'Kreditnotadato' if credit_memo else 'Fakturadato'
         number_label = 'Kreditnotanr.' if credit_memo else 'Fakturanr.'
         meta_html = (
-            f"<para alignment='right'>{date_label}: {invoice_date.strftime('%d.%m.%Y')}<br/>"
+            f"<para alignment='right'>{date_label}: {_format_date(invoice_date.date(), '%d.%m.%Y')}<br/>"
             f"{number_label}: {invoice_number}</para>"
         )
         brand_block_flowables.append(Paragraph(meta_html, self.styles['InvoiceInfo']))
@@ -345,141 +724,85 @@ class InvoicePDFGenerator:
         # Nested table on right for brand + meta, right aligned
         from reportlab.platypus import Table as RLTable
         right_table = RLTable([[f] for f in brand_block_flowables], colWidths=[right_col_width])
-        right_table.setStyle(TableStyle([
-            ('ALIGN', (0,0), (-1,-1), 'RIGHT'),
-            ('VALIGN', (0,0), (-1,-1), 'TOP'),
-            ('LEFTPADDING', (0,0), (-1,-1), 0),
-            ('RIGHTPADDING', (0,0), (-1,-1), 0),
-            ('TOPPADDING', (0,0), (-1,-1), 0),
-            ('BOTTOMPADDING', (0,0), (-1,-1), 0),
-        ]))
+        right_table.setStyle(HEADER_BRAND_TABLE_STYLE)
 
         row = [Paragraph(customer_block, self.styles['CompanyDetails']), right_table]
         table = Table([row], colWidths=[left_col_width, right_col_width])
-        table.setStyle(TableStyle([
-            ('VALIGN', (0,0), (-1,-1), 'TOP'),
-            ('ALIGN', (1,0), (1,0), 'RIGHT'),
-            ('LEFTPADDING', (0,0), (-1,-1), 0),
-            ('RIGHTPADDING', (0,0), (-1,-1), 0),
-            ('TOPPADDING', (0,0), (-1,-1), 0),
-            ('BOTTOMPADDING', (0,0), (-1,-1), 0),
-        ]))
+        table.setStyle(HEADER_TABLE_STYLE)
         return table
 
     def _create_new_items_table(self, tasks: List[Dict[str, str]], company_details: Dict[str, str]) -> Table:
-        # Determine if any discount exists (non-empty and not 0 or 0.0)
-        any_discount = False
-        for t in tasks:
-            d_raw = str(t.get('discount_percentage', '')).strip()
-            if d_raw and d_raw not in ('0', '0.0', '0.00'):
-                try:
-                    if float(d_raw) != 0.0:
-                        any_discount = True
-                        break
-                except ValueError:
-                    # If non-numeric but present, consider it a discount marker
-                    any_discount = True
-                    break
+        if not tasks:
+            # Nothing to parse, sum or stripe; Table keeps the row lists, so hand it copies
+            table = Table([list(row) for row in _EMPTY_ITEMS_ROWS], colWidths=ITEMS_COL_WIDTHS)
+            table.setStyle(ITEMS_TABLE_STYLE)
+            return table
 
-        if any_discount:
-            headers = ['Tasktype', 'Task description', 'Min. forbrugt', 'Pris', 'Discount %', 'Sum']
-        else:
-            headers = ['Tasktype', 'Task description', 'Min. forbrugt', 'Pris', 'Sum']
+        any_discount = _has_discount(tasks)
+        headers = ITEMS_HEADERS_DISCOUNT if any_discount else ITEMS_HEADERS
 
-        data = [headers]
-        subtotal = 0.0
+        data = [list(headers)]
         from reportlab.platypus import Paragraph as RLParagraph
-        for t in tasks:
-            tasktype = t.get('tasktype','')
-            desc_raw = t.get('description','') or ''
-            # Escape simple problematic characters (basic) – ReportLab handles most text
-            desc_para = RLParagraph(desc_raw.replace('&','&amp;').replace('<','&lt;').replace('>','&gt;'), self.styles['TaskDescription'])
-            time_min = t.get('time_minutes','')
-            price = t.get('price','0')
-            discount = t.get('discount_percentage','0')
-            line_sum = t.get('sum','0')
-            try:
-                subtotal += float(line_sum) if line_sum else 0.0
-            except ValueError:
-                pass
-            if any_discount:
-                row = [tasktype, desc_para, time_min, price, discount, line_sum]
-            else:
-                row = [tasktype, desc_para, time_min, price, line_sum]
-            data.append(row)
-
-        # Summary rows
-        moms = subtotal * 0.25
-        total = subtotal + moms
+        desc_style = self.styles['TaskDescription']
+        # Escape markup characters in one pass so ReportLab's paragraph parser sees plain text
+        descriptions = [RLParagraph(html.escape(t.get('description','') or '', quote=False), desc_style) for t in tasks]
         if any_discount:
-            data.append(['', '', '', '', 'Moms (25%)', f"{moms:.2f}"])
-            data.append(['', '', '', '', 'Samlet pris', f"{total:.2f}"])
+            data.extend(
+                [t.get('tasktype',''), desc, t.get('time_minutes',''), t.get('price','0'), t.get('discount_percentage','0'), t.get('sum','0')]
+                for t, desc in zip(tasks, descriptions)
+            )
         else:
-            data.append(['', '', '', 'Moms (25%)', f"{moms:.2f}"])
-            data.append(['', '', '', 'Samlet pris', f"{total:.2f}"])
+            data.extend(
+                [t.get('tasktype',''), desc, t.get('time_minutes',''), t.get('price','0'), t.get('sum','0')]
+                for t, desc in zip(tasks, descriptions)
+            )
+
+        # Summary rows
+        subtotal, moms, total = _invoice_totals(tasks)
+        # Label and amount go in the last two columns of either layout
+        padding = [''] * (len(headers) - 2)
+        data.append(padding + ['Moms (25%)', _format_amount(moms)])
+        data.append(padding + ['Samlet pris', _format_amount(total)])
 
-        # Column width proportions originally based on 18cm total; adjust if discount column removed
-        if any_discount:
-            fractions = [0.1667, 0.3333, 0.1222, 0.1222, 0.1222, 0.1334]  # sum ~1.0
-        else:
-            # Reallocate previous discount fraction proportionally to description and sum columns
-            fractions = [0.18, 0.38, 0.14, 0.14, 0.16]  # must sum ~1.0
-        col_widths = [CONTENT_WIDTH * f for f in fractions]
-
-        table = Table(data, colWidths=col_widths)
-        # Build table style dynamically based on column count
-        style_cmds = [
-            ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-            ('BACKGROUND', (0,0), (-1,0), colors.whitesmoke),
-            ('LINEBELOW', (0,0), (-1,0), 0.5, colors.black),
-            ('VALIGN', (0,0), (-1,-1), 'TOP'),
-            # Header slightly larger than body
-            ('FONTSIZE', (0,0), (-1,0), 9),
-            ('FONTSIZE', (0,1), (-1,-1), 8),
-            ('TOPPADDING', (0,0), (-1,0), 4),
-            ('BOTTOMPADDING', (0,0), (-1,0), 4),
-            ('TOPPADDING', (0,1), (-1,-1), 2),
-            ('BOTTOMPADDING', (0,1), (-1,-1), 2),
-        ]
-        # Alignment indices depend on discount presence
         if any_discount:
-            # Columns: 0 tasktype,1 desc,2 min,3 price,4 discount,5 sum
-            style_cmds.extend([
-                ('ALIGN', (2,1), (2,-3), 'RIGHT'),
-                ('ALIGN', (3,1), (5,-1), 'RIGHT'),
-                ('LINEABOVE', (4,-2), (5,-2), 0.5, colors.black),
-                ('FONTNAME', (4,-1), (5,-1), 'Helvetica-Bold'),
-            ])
+            table = Table(data, colWidths=ITEMS_COL_WIDTHS_DISCOUNT)
+            table.setStyle(ITEMS_TABLE_STYLE_DISCOUNT)
         else:
-            # Columns: 0 tasktype,1 desc,2 min,3 price,4 sum
-            style_cmds.extend([
-                ('ALIGN', (2,1), (2,-3), 'RIGHT'),
-                ('ALIGN', (3,1), (4,-1), 'RIGHT'),
-                ('LINEABOVE', (3,-2), (4,-2), 0.5, colors.black),
-                ('FONTNAME', (3,-1), (4,-1), 'Helvetica-Bold'),
-            ])
-        table.setStyle(TableStyle(style_cmds))
-        # Apply alternating row background stripes (exclude header and summary rows)
-        try:
-            total_rows = len(data)
-            # Data rows are from 1 to total_rows - 3 (because last 2 are summary rows)
-            data_end = total_rows - 3 if total_rows >= 3 else 0
-            if data_end > 0:
-                stripe_color_1 = colors.whitesmoke  # keep header distinct
-                stripe_color_2 = colors.Color(0.95, 0.95, 0.95)
-                for row_idx in range(1, data_end + 1):
-                    if row_idx % 2 == 1:
-                        # Slightly different very light grey
-                        table.setStyle(TableStyle([
-                            ('BACKGROUND', (0, row_idx), (-1, row_idx), stripe_color_2)
-                        ]))
-                    # Even rows stay default (white)
-        except Exception as e:
-            logger.warning(f"Failed applying row stripes: {e}")
+            table = Table(data, colWidths=ITEMS_COL_WIDTHS)
+            table.setStyle(ITEMS_TABLE_STYLE)
+        # Stripe odd data rows (header and summary rows excluded) with one setStyle call
+        table.setStyle(TableStyle([
+            ('BACKGROUND', (0, row_idx), (-1, row_idx), ITEMS_STRIPE_COLOR)
+            for row_idx in range(1, len(tasks) + 1, 2)
+        ]))
         return table
     
-    def _create_payment_section(self, company_details: Dict[str, str], invoice_date: datetime, invoice_number: int, credit_memo: bool = False) -> Table:
-        """Create payment terms and banking information section
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _customer_block(name: str, address: str, zip_code: str, town: str) -> str:
+        """Customer address markup (empty lines dropped) with the name in bold on the first line"""
+        lines = [
+            f"<b>{name}</b>" if name else '',
+            address,
+            f"{zip_code} {town}".strip(),
+        ]
+        return '<br/>'.join([l for l in lines if l])
+    
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _bank_markup(bank_name: str, bank_account: str) -> str:
+        """Bank name plus reg./account numbers for the payment terms, split from 'regnr / kontonr'"""
+        bank_name = bank_name or 'Bank'
+        bank_account = bank_account or ''
+        regnr = ''
+        if bank_account and '/' in bank_account:
+            parts = [p.strip() for p in bank_account.split('/')]
+            if len(parts) == 2 and parts[0].replace(' ', '').isdigit():
+                regnr = parts[0]
+        return f"<b>{bank_name}</b>{f' - Regnr.: <b>{regnr}</b>' if regnr else ''}{f' / Kontonr.: <b>{bank_account}</b>' if bank_account else ''}"
+    
+    def _payment_info_markup(self, company_details: Dict[str, str], invoice_date: datetime, invoice_number: int, credit_memo: bool = False) -> str:
+        """Payment terms and banking information text (inline <b>/<i>/<br/> markup)
 
         Priority for payment terms days:
         1. company_details['payment_terms_days'] if set and valid int
@@ -506,22 +829,20 @@ class InvoicePDFGenerator:
                     pass
 
         due_date = invoice_date + timedelta(days=payment_terms_days)
-        bank_name = company_details.get('bank_name', '') or 'Bank'
-        bank_account = company_details.get('bank_account', '') or ''
-        regnr = ''
-        if bank_account and '/' in bank_account:
-            parts = [p.strip() for p in bank_account.split('/')]
-            if len(parts) == 2 and parts[0].replace(' ', '').isdigit():
-                regnr = parts[0]
         if credit_memo:
             payment_info = f"""<b>Kreditnota:</b> Denne kreditnota vedrører refusion/korrektion af tidligere fakturering.<br/>
     Kreditnotanr. <b>{invoice_number}</b> bedes anført ved bogføring.<br/>
-    Udstedelsesdato: <b>{invoice_date.strftime('%d.%m.%Y')}</b>"""
+    Udstedelsesdato: <b>{_format_date(invoice_date.date(), '%d.%m.%Y')}</b>"""
         else:
-            payment_info = f"""<b>Betalingsbetingelser:</b> Netto {payment_terms_days} dage - forfalden {due_date.strftime('%d.%m.%Y')}<br/>
-    Beløbet indbetales til vor bank. <b>{bank_name}</b>{f' - Regnr.: <b>{regnr}</b>' if regnr else ''}{f' / Kontonr.: <b>{bank_account}</b>' if bank_account else ''}<br/>
+            payment_info = f"""<b>Betalingsbetingelser:</b> Netto {payment_terms_days} dage - forfalden {_format_date(due_date.date(), '%d.%m.%Y')}<br/>
+    Beløbet indbetales til vor bank. {self._bank_markup(company_details.get('bank_name', ''), company_details.get('bank_account', ''))}<br/>
     Fakturanr. <b>{invoice_number}</b> bedes anført ved bankoverførsel<br/><br/>
     <i>Ved for sen betaling påregnes rente i henhold til gældende lovgivning.</i>"""
+        return payment_info
+    
+    def _create_payment_section(self, company_details: Dict[str, str], invoice_date: datetime, invoice_number: int, credit_memo: bool = False) -> Table:
+        """Create payment terms and banking information section"""
+        payment_info = self._payment_info_markup(company_details, invoice_date, invoice_number, credit_memo=credit_memo)
         
         # Create payment section
         payment_data = [
@@ -529,29 +850,26 @@ class InvoicePDFGenerator:
         ]
         # Use unified CONTENT_WIDTH for payment section to align with other elements
         payment_table = Table(payment_data, colWidths=[CONTENT_WIDTH])
-        payment_table.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('TOPPADDING', (0, 0), (-1, -1), 20),
-        ]))
+        payment_table.setStyle(PAYMENT_TABLE_STYLE)
 
         return payment_table
     
-    def _draw_page_elements(self, canvas, doc, company_details: Dict[str, str]) -> None:
-        """Draw footer dynamically from company details file"""
-        name = company_details.get('company_name', '')
-        address = company_details.get('company_address', '')
-        zip_code = company_details.get('company_zip', '')
-        town = company_details.get('company_town', '')
-        cvr = company_details.get('company_cvr', '')
-        phone = company_details.get('company_phone', '')
-        email = company_details.get('company_email', '')
-        bank_name = company_details.get('bank_name', '')
-        bank_account = company_details.get('bank_account', '')
-        iban = company_details.get('iban', '')
-        swift = company_details.get('swift', '')
-        extra = company_details.get('additional_info', '')
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _footer_lines(values: Tuple[str, ...]) -> Tuple[Tuple[float, str], ...]:
+        """
+        Compose the centered footer lines for one set of company details
+        
+        Runs on every page, so the joined strings and their x positions are
+        cached per sender instead of being rebuilt for each page and invoice.
+        
+        Args:
+            values: Company detail values in FOOTER_FIELDS order
+            
+        Returns:
+            (x_position, line) pairs from top to bottom
+        """
+        name, address, zip_code, town, cvr, phone, email, bank_name, bank_account, iban, swift, extra = values
 
         footer_lines = []
         line1_parts = [p for p in [name, address, f"{zip_code} {town}".strip(), f"CVR: {cvr}" if cvr else ''] if p]
@@ -566,13 +884,81 @@ class InvoicePDFGenerator:
         if extra:
             footer_lines.append(extra)
 
-        canvas.setFont('Helvetica', 8)
-        y_position = 2*cm
-        for line in footer_lines:
-            text_width = canvas.stringWidth(line, 'Helvetica', 8)
-            x_position = (A4[0] - text_width) / 2
-            canvas.drawString(x_position, y_position, line)
-            y_position -= 10
-        canvas.setStrokeColor(colors.black)
-        canvas.setLineWidth(0.5)
-        canvas.line(2.0*cm, 2.5*cm, A4[0] - 2.0*cm, 2.5*cm)
\ No newline at end of file
+        return tuple(
+            ((A4[0] - stringWidth(line, 'Helvetica', 8)) / 2, line)
+            for line in footer_lines
+        )
+    
+    def _draw_page_elements(self, canvas, doc, company_details: Dict[str, str]) -> None:
+        """Draw footer dynamically from company details file
+
+        The footer is identical on every page, so it is recorded once per document
+        as a PDF form XObject and later pages only reference it.
+        """
+        if not canvas.hasForm(FOOTER_FORM_NAME):
+            footer = self._footer_lines(tuple(company_details.get(field, '') for field in FOOTER_FIELDS))
+            canvas.beginForm(FOOTER_FORM_NAME)
+            canvas.setFont('Helvetica', 8)
+            y_position = 2*cm
+            for x_position, line in footer:
+                canvas.drawString(x_position, y_position, line)
+                y_position -= 10
+            canvas.setStrokeColor(colors.black)
+            canvas.setLineWidth(0.5)
+            canvas.line(2.0*cm, 2.5*cm, A4[0] - 2.0*cm, 2.5*cm)
+            canvas.endForm()
+        canvas.doForm(FOOTER_FORM_NAME)
+
+
+# Per-worker generator for generate_invoices_bulk, built once by _init_worker
+_worker_generator: Optional[InvoicePDFGenerator] = None
+
+
+def _init_worker(log_queue: Optional[multiprocessing.queues.Queue] = None, log_level: int = logging.INFO) -> None:
+    global _worker_generator
+    if log_queue is not None:
+        # Send records to the parent's log listener instead of dropping them
+        root = logging.getLogger()
+        root.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+        root.setLevel(log_level)
+    _worker_generator = InvoicePDFGenerator()
+
+
+def _parent_log_queue() -> Optional[multiprocessing.queues.Queue]:
+    """Multiprocessing queue behind the root logger's QueueHandler, if logging is set up that way"""
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, logging.handlers.QueueHandler) and isinstance(handler.queue, multiprocessing.queues.Queue):
+            return handler.queue
+    return None
+
+
+def _render_single(job: Dict[str, Any]) -> str:
+    return _worker_generator.generate_invoice_pdf(**job)
+
+
+def generate_invoices_bulk(jobs: List[Dict[str, Any]], max_workers: Optional[int] = None) -> List[str]:
+    """
+    Render many invoice PDFs in parallel worker processes
+    
+    ReportLab rendering is pure Python and CPU bound, so independent invoices
+    are spread over a process pool rather than built one after another.
+    
+    Args:
+        jobs: One dict per invoice holding the keyword arguments of
+              InvoicePDFGenerator.generate_invoice_pdf (invoice_number,
+              company_details, customer_details, tasks, ...)
+        max_workers: Number of worker processes (defaults to os.cpu_count())
+        
+    Returns:
+        Paths of the generated PDF files, in the same order as jobs
+        
+    Raises:
+        Exception: The first error raised while rendering any of the invoices
+    """
+    if not jobs:
+        return []
+    logger.info("Generating %d invoice PDFs in parallel", len(jobs))
+    initargs = (_parent_log_queue(), logging.getLogger().level)
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(), initializer=_init_worker,
+                             initargs=initargs) as executor:
+        return list(executor.map(_render_single, jobs, chunksize=4))